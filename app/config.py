@@ -17,10 +17,23 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-5-mini"
     quick_suggestion_model: str = "gpt-5-nano"
     quick_suggestion_timeout_seconds: int = 20
+    openai_batch_max_concurrency: int = 2  # in-flight Batch API jobs
     default_output_language: str = "English"
     share_token_ttl_minutes: int = 240  # 4 hours default
     upload_session_ttl_minutes: int = 60  # keep uploaded files for retries
     database_url: Optional[str] = None
+    database_read_url: Optional[str] = None  # optional read replica for lookups
+    redis_url: Optional[str] = None  # optional upload-session cache
+    # Per-process upload-session lookup cache; single-worker deployments only,
+    # since other workers never see its invalidations. Ignored with REDIS_URL.
+    upload_session_process_cache: bool = False
+    # SQLAlchemy's defaults; each uvicorn worker opens its own pool per engine,
+    # so raise these only with Postgres max_connections headroom to spare.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
+    db_prepared_statement_cache_size: int = 256  # per connection, asyncpg only
+    trust_persisted_templates: bool = True  # skip re-validating stored JSONB
 
 
 @lru_cache
@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+from functools import partial
 from typing import AsyncIterator
 
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
 Base = declarative_base()
 
+logger = logging.getLogger(__name__)
+
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_read_engine: AsyncEngine | None = None
+_read_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 def _ensure_async_driver(raw_url: str) -> str:
-    """Return a SQLAlchemy URL string using an async driver when possible."""
+    """Return a SQLAlchemy URL string using an async driver when possible.
+
+    asyncpg URLs also carry the configured prepared-statement cache size.
+    """
 
     url = make_url(raw_url)
     backend = url.get_backend_name()
@@ -26,14 +38,42 @@ def _ensure_async_driver(raw_url: str) -> str:
         drivername = f"{backend}+asyncpg"
         url = url.set(drivername=drivername)
 
+    cache_option = "prepared_statement_cache_size"
+    if "+asyncpg" in url.drivername and cache_option not in url.query:
+        url = url.update_query_dict(
+            {cache_option: str(settings.db_prepared_statement_cache_size)}
+        )
+
     return url.render_as_string(hide_password=False)
 
 
+def _create_engine(raw_url: str, **options) -> AsyncEngine:
+    return create_async_engine(
+        _ensure_async_driver(raw_url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        # Compact separators keep JSON/JSONB parameters free of whitespace.
+        json_serializer=partial(json.dumps, separators=(",", ":")),
+        **options,
+    )
+
+
 if settings.database_url:
-    normalised_url = _ensure_async_driver(settings.database_url)
-    _engine = create_async_engine(normalised_url, pool_pre_ping=True)
+    _engine = _create_engine(settings.database_url)
     _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
 
+if settings.database_url and settings.database_read_url:
+    # Optional read-only target, e.g. a streaming-replica hot standby.
+    _read_engine = _create_engine(
+        settings.database_read_url,
+        execution_options={"postgresql_readonly": True},
+    )
+    _read_session_factory = async_sessionmaker(_read_engine, expire_on_commit=False)
+
 
 def get_engine() -> AsyncEngine | None:
     """Return the configured async engine, if a database URL is set."""
@@ -47,6 +87,40 @@ def get_session_factory() -> async_sessionmaker[AsyncSession] | None:
     return _session_factory
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession] | None:
+    """Return the read-only session factory when DATABASE_READ_URL is set."""
+
+    return _read_session_factory
+
+
+async def warmup() -> None:
+    """Open the pools' connections up front so early bursts skip connect latency."""
+
+    engines = [engine for engine in (_engine, _read_engine) if engine is not None]
+    if len(engines) == 2 and _read_engine.url == _engine.url:
+        # DATABASE_READ_URL points at the primary; one warm pool is enough.
+        engines.pop()
+    await asyncio.gather(*(_warm_engine(engine) for engine in engines))
+
+
+async def _warm_engine(engine: AsyncEngine) -> None:
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.db_pool_size)),
+        return_exceptions=True,
+    )
+    connections = [
+        result for result in results if not isinstance(result, BaseException)
+    ]
+    await asyncio.gather(*(connection.close() for connection in connections))
+    if len(connections) < len(results):
+        logger.warning(
+            "Database warmup opened %d of %d connections to %s",
+            len(connections),
+            len(results),
+            engine.url.render_as_string(hide_password=True),
+        )
+
+
 async def get_session() -> AsyncIterator[AsyncSession]:
     """FastAPI dependency for acquiring an async session."""
 
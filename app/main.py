@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
 from fastapi import FastAPI, Request
@@ -5,7 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
-import segno
+from .db import warmup as warmup_database
 from .i18n import (
     determine_locale,
     get_gettext_functions,
@@ -14,14 +15,34 @@ from .i18n import (
     normalize_locale,
 )
 from .routes import router as menu_router
-from .routes.menu import get_share_service
+from .routes.menu import (
+    get_menu_service,
+    get_share_service,
+    get_upload_session_service,
+)
 from .schemas import MenuTemplate
+from .services.share import share_qr_data_uri
 from .static_data import get_matched_photo_feed
 
 templates = Jinja2Templates(directory="app/templates")
 templates.env.add_extension("jinja2.ext.i18n")
 
-app = FastAPI(title="mainu Web", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the DB pool, run maintenance, and release connections on shutdown."""
+    await warmup_database()
+    share_service = get_share_service()
+    share_service.start()
+    try:
+        yield
+    finally:
+        await share_service.stop()
+        await get_menu_service().aclose()
+        await get_upload_session_service().aclose()
+
+
+app = FastAPI(title="mainu Web", version="0.1.0", lifespan=lifespan)
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
@@ -117,7 +138,6 @@ async def share_view(request: Request, token: str):
     """Render a read-only viewer for shared menus."""
 
     share_service = get_share_service()
-    await share_service.purge_expired()
     record = await share_service.describe(token)
     if record is None:
         return templates.TemplateResponse(
@@ -146,9 +166,7 @@ async def share_view(request: Request, token: str):
                 "expires_at": record.expires_at,
                 "expires_in_seconds": record.ttl_seconds,
                 "share_url": str(request.url),
-                "share_qr": segno.make_qr(str(request.url)).png_data_uri(
-                    scale=4, dark="#1d5bdb", light="#f8fafc"
-                ),
+                "share_qr": share_qr_data_uri(str(request.url)),
                 "is_expired": False,
             },
         ),
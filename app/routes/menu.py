@@ -9,11 +9,9 @@ from contextlib import suppress
 from io import BytesIO
 from typing import List, Sequence, Tuple
 
-import segno
 from PIL import Image, UnidentifiedImageError
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile
-from fastapi.responses import JSONResponse
 from sse_starlette.sse import EventSourceResponse
 
 from app.config import settings
@@ -25,8 +23,8 @@ from app.schemas import (
     MenuRetryRequest,
 )
 from app.services.llm import LLMMenuService, MenuProcessingArtifacts
-from app.services.tips import Tip, TipService
-from app.services.share import ShareService
+from app.services.tips import Tip, TipService, default_tip_service
+from app.services.share import ShareService, share_qr_data_uri
 from app.services.upload_session import UploadSessionService
 
 router = APIRouter(prefix="/menu", tags=["menu"])
@@ -35,7 +33,7 @@ logger = logging.getLogger(__name__)
 
 _menu_service = LLMMenuService()
 _share_service = ShareService()
-_tip_service = TipService()
+_tip_service = default_tip_service
 _upload_session_service = UploadSessionService()
 
 _MAX_IMAGE_DIMENSION = 1280
@@ -89,31 +87,31 @@ async def process_menu(
     if not files:
         raise HTTPException(status_code=400, detail="At least one image is required")
 
-    contents: List[bytes] = []
-    filenames: List[str] = []
-    content_types: List[str] = []
-    for upload in files:
-        if upload.content_type not in {"image/jpeg", "image/png", "image/heic"}:
-            raise HTTPException(status_code=400, detail="Unsupported file type")
-        raw = await upload.read()
-        if not raw:
-            raise HTTPException(status_code=400, detail="Empty file uploaded")
-        optimised, content_type = _optimise_image_payload(raw, upload.content_type)
-        contents.append(optimised)
-        filenames.append(upload.filename or "menu-page")
-        content_types.append(content_type)
+    contents, filenames, content_types = await _read_image_uploads(files)
 
-    await _purge_expired_sessions(menu_service, session_service)
+    # Start the upload first so session housekeeping overlaps with it.
+    upload_task = asyncio.create_task(
+        menu_service.upload_images(
+            contents,
+            filenames,
+            content_types,
+        )
+    )
 
     resolved_language = _resolve_output_language(requested_output_language)
     output_language = resolved_language or _detect_language(request)
     logger.debug("Processing menu with output language: %s", output_language)
 
-    file_ids: List[str] = await menu_service.upload_images(
-        contents,
-        filenames,
-        content_types,
-    )
+    try:
+        await _purge_expired_sessions(menu_service, session_service)
+        # Shielded so a cancelled request does not abort the upload halfway
+        # and strand whichever files already reached OpenAI.
+        file_ids: List[str] = await asyncio.shield(upload_task)
+    except BaseException:
+        # Covers cancellation (e.g. client disconnect) as well as errors; the
+        # cleanup is shielded too so it outlives the cancelled request.
+        await asyncio.shield(_discard_upload(menu_service, upload_task))
+        raise
 
     try:
         artifacts = await _generate_menu_from_file_ids(
@@ -250,19 +248,7 @@ async def suggest_menu_highlights(
     if not files:
         raise HTTPException(status_code=400, detail="At least one image is required")
 
-    contents: List[bytes] = []
-    filenames: List[str] = []
-    content_types: List[str] = []
-    for upload in files:
-        if upload.content_type not in {"image/jpeg", "image/png", "image/heic"}:
-            raise HTTPException(status_code=400, detail="Unsupported file type")
-        raw = await upload.read()
-        if not raw:
-            raise HTTPException(status_code=400, detail="Empty file uploaded")
-        optimised, content_type = _optimise_image_payload(raw, upload.content_type)
-        contents.append(optimised)
-        filenames.append(upload.filename or "menu-page")
-        content_types.append(content_type)
+    contents, filenames, content_types = await _read_image_uploads(files)
 
     try:
         text: str = await asyncio.wait_for(
@@ -289,7 +275,6 @@ async def create_share_link(
     payload: ShareMenuRequest,
     share_service: ShareService = Depends(get_share_service),
 ) -> ShareMenuResponse:
-    await share_service.purge_expired()
     token = await share_service.create_template(payload.template)
     record = await share_service.describe(token)
     if record is None:
@@ -297,8 +282,7 @@ async def create_share_link(
 
     share_html_url = str(request.url_for("share_view", token=token))
     share_api_url = str(request.url_for("get_shared_menu", token=token))
-    qr = segno.make_qr(share_html_url)
-    qr_data = qr.png_data_uri(scale=4, dark="#1d5bdb", light="#f8fafc")
+    qr_data = share_qr_data_uri(share_html_url)
 
     return ShareMenuResponse(
         share_token=token,
@@ -315,7 +299,6 @@ async def get_shared_menu(
     token: str,
     share_service: ShareService = Depends(get_share_service),
 ) -> MenuTemplate:
-    await share_service.purge_expired()
     template = await share_service.fetch_template(token)
     if template is None:
         raise HTTPException(status_code=404, detail="Share link expired or invalid")
@@ -350,10 +333,9 @@ async def stream_menu_tips(
     request: Request,
     tip_service: TipService = Depends(get_tip_service),
 ):
-    tips = await tip_service.get_tips()
-    tip_count = len(tips)
-
     if request is not None and "text/event-stream" in request.headers.get("accept", ""):
+        tips = tip_service.get_tips()
+        tip_count = len(tips)
 
         async def event_generator():
             try:
@@ -372,7 +354,10 @@ async def stream_menu_tips(
 
         return EventSourceResponse(event_generator())
 
-    return JSONResponse([_tip_to_dict(tip) for tip in tips])
+    return Response(
+        content=tip_service.get_tips_json(),
+        media_type="application/json",
+    )
 
 
 def _tip_event(event: str, tip: Tip) -> dict[str, str]:
@@ -389,16 +374,6 @@ def _tip_event(event: str, tip: Tip) -> dict[str, str]:
     return {"event": event, "data": json.dumps(payload)}
 
 
-def _tip_to_dict(tip: Tip) -> dict[str, str | None]:
-    return {
-        "title": tip.title,
-        "body": tip.body,
-        "image_url": tip.image_url,
-        "source_name": tip.source_name,
-        "source_url": tip.source_url,
-    }
-
-
 async def _generate_menu_from_file_ids(
     menu_service: LLMMenuService,
     file_ids: Sequence[str],
@@ -471,6 +446,19 @@ async def _await_suggestion_task(
         return ""
 
 
+async def _discard_upload(
+    menu_service: LLMMenuService, upload_task: asyncio.Task[List[str]]
+) -> None:
+    """Wait for an upload whose request failed and delete its files."""
+
+    try:
+        file_ids = await upload_task
+    except Exception:
+        return
+    with suppress(Exception):
+        await menu_service.delete_files(file_ids)
+
+
 async def _purge_expired_sessions(
     menu_service: LLMMenuService, session_service: UploadSessionService
 ) -> None:
@@ -483,6 +471,33 @@ async def _purge_expired_sessions(
     )
 
 
+async def _read_image_uploads(
+    files: Sequence[UploadFile],
+) -> Tuple[List[bytes], List[str], List[str]]:
+    """Validate uploads and optimise each image in a worker thread."""
+
+    raw_payloads: List[Tuple[bytes, str]] = []
+    filenames: List[str] = []
+    for upload in files:
+        if upload.content_type not in {"image/jpeg", "image/png", "image/heic"}:
+            raise HTTPException(status_code=400, detail="Unsupported file type")
+        raw = await upload.read()
+        if not raw:
+            raise HTTPException(status_code=400, detail="Empty file uploaded")
+        raw_payloads.append((raw, upload.content_type))
+        filenames.append(upload.filename or "menu-page")
+
+    optimised = await asyncio.gather(
+        *(
+            asyncio.to_thread(_optimise_image_payload, raw, content_type)
+            for raw, content_type in raw_payloads
+        )
+    )
+    contents = [payload for payload, _ in optimised]
+    content_types = [content_type for _, content_type in optimised]
+    return contents, filenames, content_types
+
+
 def _optimise_image_payload(raw: bytes, content_type: str) -> Tuple[bytes, str]:
     """Downscale and recompress menu images to reduce upload latency."""
 
@@ -491,8 +506,11 @@ def _optimise_image_payload(raw: bytes, content_type: str) -> Tuple[bytes, str]:
 
     try:
         with Image.open(BytesIO(raw)) as image:
-            image.load()
             original_size = image.size
+            if content_type == "image/jpeg":
+                # Let libjpeg decode at a reduced scale instead of full size.
+                image.draft("RGB", (_MAX_IMAGE_DIMENSION, _MAX_IMAGE_DIMENSION))
+            image.load()
             processed = image.copy()
     except (UnidentifiedImageError, OSError):
         return raw, content_type
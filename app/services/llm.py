@@ -4,21 +4,70 @@ from __future__ import annotations
 
 import asyncio
 import json
-from collections import defaultdict
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
-from typing import AsyncIterator, Iterable, List, Sequence
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterable, List, Sequence, TypedDict
 
 from openai import AsyncOpenAI, OpenAIError
+from openai.types import Batch
+from openai.types.responses import Response
+from pydantic import TypeAdapter, ValidationError
 
 from app.config import settings
 from app.schemas import MenuDish, MenuSection, MenuTemplate
 from app.services.prompt import (
+    PromptInput,
+    PromptRequest,
     build_prompt,
+    build_prompts_batch,
     build_reasoning_config,
     build_text_config,
+    build_text_config_json,
 )
 
+
+class _MenuPayload(TypedDict):
+    """Top-level structured output shape enforced by the JSON schema."""
+
+    items: List[dict[str, Any]]
+
+
+_MENU_PAYLOAD_ADAPTER: TypeAdapter[_MenuPayload] = TypeAdapter(_MenuPayload)
+_DISHES_ADAPTER: TypeAdapter[List[MenuDish]] = TypeAdapter(List[MenuDish])
+
+# Request configs are constant for the process lifetime; build them once so the
+# strict JSON schema is not deep-copied and reassembled on every extraction.
+_EXTRACT_TEXT_CONFIG = build_text_config()
+_EXTRACT_TEXT_CONFIG_JSON = build_text_config_json()
+_EXTRACT_REASONING_CONFIG = build_reasoning_config()
+_QUICK_SUGGEST_TEXT_CONFIG = {"verbosity": "low"}
+_QUICK_SUGGEST_REASONING_CONFIG = {"effort": "minimal"}
+
+_BATCH_ENDPOINT = "/v1/responses"
+_BATCH_COMPLETION_WINDOW = "24h"
+_BATCH_POLL_INITIAL_SECONDS = 5.0
+_BATCH_POLL_MAX_SECONDS = 300.0
+_BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+
+
+@lru_cache(maxsize=1)
+def _openai_client() -> AsyncOpenAI:
+    """Return the process-wide OpenAI client so one connection pool is shared."""
+
+    return AsyncOpenAI(api_key=settings.openai_api_key)
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared OpenAI client if one has been created."""
+
+    if _openai_client.cache_info().currsize == 0:
+        return
+    client = _openai_client()
+    _openai_client.cache_clear()
+    await client.close()
+
+
 @dataclass(frozen=True)
 class MenuGenerationResult:
     """Structured result produced by the LLM generation flow."""
@@ -34,6 +83,15 @@ class MenuProcessingArtifacts:
     quick_suggestion: str
 
 
+@dataclass(frozen=True)
+class MenuBatchJob:
+    """Single menu extraction submitted through the OpenAI Batch API."""
+
+    custom_id: str
+    file_ids: Sequence[str]
+    output_language: str | None = None
+
+
 class LLMMenuService:
     """Service responsible for converting menu images into structured templates."""
 
@@ -42,16 +100,28 @@ class LLMMenuService:
         client: AsyncOpenAI | None = None,
     ) -> None:
         self._client = client
+        self._pending_cleanups: set[asyncio.Task[None]] = set()
+        # Cap concurrently submitted Batch API jobs to the enqueued-token budget.
+        self._batch_slots = asyncio.Semaphore(
+            max(1, settings.openai_batch_max_concurrency)
+        )
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazily instantiate an OpenAI client."""
+        """Return the injected client or the lazily created shared one."""
 
-        if self._client is None:
-            if not settings.openai_api_key:
-                raise RuntimeError("OPENAI_API_KEY is required to process menus")
-            self._client = AsyncOpenAI(api_key=settings.openai_api_key)
-        return self._client
+        if self._client is not None:
+            return self._client
+        if not settings.openai_api_key:
+            raise RuntimeError("OPENAI_API_KEY is required to process menus")
+        return _openai_client()
+
+    async def aclose(self) -> None:
+        """Finish pending file cleanups and close the shared OpenAI client."""
+
+        if self._pending_cleanups:
+            await asyncio.gather(*self._pending_cleanups, return_exceptions=True)
+        await aclose_shared_client()
 
     async def upload_images(
         self,
@@ -155,6 +225,60 @@ class LLMMenuService:
         template = _build_menu_template(payload)
         return MenuGenerationResult(template=template)
 
+    async def generate_menu_templates_batch(
+        self,
+        jobs: Sequence[MenuBatchJob],
+    ) -> dict[str, MenuGenerationResult]:
+        """Extract many menus through the OpenAI Batch API.
+
+        Intended for offline ingestion and backfills rather than the
+        interactive flow: batches are billed at a discount and have higher
+        rate limits, but may take up to 24 hours to complete. Results are
+        keyed by ``custom_id``; jobs that failed individually are omitted.
+        """
+
+        if not jobs:
+            return {}
+
+        prompts = build_prompts_batch(
+            [
+                PromptInput(
+                    job.file_ids,
+                    job.output_language or settings.default_output_language,
+                )
+                for job in jobs
+            ]
+        )
+        lines = [
+            self._build_batch_line(job.custom_id, prompt)
+            for job, prompt in zip(jobs, prompts)
+        ]
+
+        async with self._batch_slots:
+            output = await self._submit_batch(lines)
+        if output is None:
+            return {}
+
+        results: dict[str, MenuGenerationResult] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                response_entry = entry.get("response") or {}
+                if entry.get("error") or response_entry.get("status_code") != 200:
+                    continue
+                response = Response.model_validate(response_entry["body"])
+                payload = _parse_menu_payload(response)
+                custom_id = entry["custom_id"]
+            except (json.JSONDecodeError, ValidationError, KeyError, RuntimeError):
+                # A malformed line only loses its own job.
+                continue
+            results[custom_id] = MenuGenerationResult(
+                template=_build_menu_template(payload)
+            )
+        return results
+
     async def generate_quick_suggestions(
         self,
         images: Sequence[bytes],
@@ -212,7 +336,62 @@ class LLMMenuService:
         try:
             yield file_ids
         finally:
-            await self._delete_files(file_ids)
+            self._schedule_cleanup(file_ids)
+
+    def _schedule_cleanup(self, file_ids: Sequence[str]) -> None:
+        """Delete uploaded files in the background so callers need not wait."""
+
+        if not file_ids:
+            return
+        task = asyncio.create_task(self._delete_files(file_ids))
+        # Keep a strong reference until the task finishes so it is not GC'd.
+        self._pending_cleanups.add(task)
+        task.add_done_callback(self._pending_cleanups.discard)
+
+    async def _submit_batch(self, lines: Sequence[str]) -> str | None:
+        """Run one Batch API job to completion and return its raw JSONL output."""
+
+        try:
+            batch_input = await self.client.files.create(
+                file=(
+                    "menu-batch.jsonl",
+                    "\n".join(lines).encode("utf-8"),
+                    "application/jsonl",
+                ),
+                purpose="batch",
+            )
+            try:
+                batch = await self.client.batches.create(
+                    input_file_id=batch_input.id,
+                    endpoint=_BATCH_ENDPOINT,
+                    completion_window=_BATCH_COMPLETION_WINDOW,
+                )
+                batch = await self._wait_for_batch(batch.id)
+            finally:
+                await self._delete_files([batch_input.id])
+
+            if batch.status in _BATCH_FAILED_STATUSES:
+                raise RuntimeError(f"OpenAI batch {batch.id} ended as {batch.status}")
+            if not batch.output_file_id:
+                return None
+            try:
+                output = await self.client.files.content(batch.output_file_id)
+            finally:
+                await self._delete_files([batch.output_file_id])
+            return output.text
+        except OpenAIError as exc:  # pragma: no cover - network failure path
+            raise RuntimeError("Failed to call OpenAI Batch API") from exc
+
+    async def _wait_for_batch(self, batch_id: str) -> Batch:
+        """Poll a batch with exponential backoff until it reaches a final state."""
+
+        delay = _BATCH_POLL_INITIAL_SECONDS
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed" or batch.status in _BATCH_FAILED_STATUSES:
+                return batch
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
 
     async def _consume_suggestion_task(
         self,
@@ -278,24 +457,53 @@ class LLMMenuService:
             return_exceptions=True,
         )
 
-
-    async def _run_extract_request(self, file_ids: Sequence[str], output_language: str) -> str:
+    async def _run_extract_request(
+        self, file_ids: Sequence[str], output_language: str
+    ) -> _MenuPayload:
         """Run pipeline to collect menu information."""
 
         if not file_ids:
-            return ""
-
-        prompt = build_prompt(file_ids, output_language=output_language)
+            return {"items": []}
 
         response = await self.client.responses.create(
-            model=settings.openai_model,
-            instructions=prompt.instructions,
-            input=[{"role": "user", "content": prompt.content}],
-            text=build_text_config(),
-            reasoning=build_reasoning_config(),
+            **self._build_extract_params(file_ids, output_language)
         )
 
-        return _extract_json_payload(response)
+        return _parse_menu_payload(response)
+
+    def _build_extract_params(
+        self, file_ids: Sequence[str], output_language: str
+    ) -> dict[str, Any]:
+        """Return Responses API parameters shared by interactive and batch calls."""
+
+        prompt = build_prompt(file_ids, output_language=output_language)
+        return self._extract_params(prompt)
+
+    def _extract_params(self, prompt: PromptRequest) -> dict[str, Any]:
+        """Wrap a built prompt in the extraction model and output configs."""
+
+        return {
+            "model": settings.openai_model,
+            "instructions": prompt.instructions,
+            "input": [{"role": "user", "content": prompt.content}],
+            "text": _EXTRACT_TEXT_CONFIG,
+            "reasoning": _EXTRACT_REASONING_CONFIG,
+        }
+
+    def _build_batch_line(self, custom_id: str, prompt: PromptRequest) -> str:
+        """Serialise one Batch API request line for ``prompt``."""
+
+        params = self._extract_params(prompt)
+        # The schema-bearing text config is identical for every job, so splice
+        # in its cached JSON rather than re-encoding it per line.
+        del params["text"]
+        body = json.dumps(params, ensure_ascii=False, separators=(",", ":"))
+        body = f'{body[:-1]},"text":{_EXTRACT_TEXT_CONFIG_JSON}}}'
+        encoded_id = json.dumps(custom_id, ensure_ascii=False)
+        return (
+            f'{{"custom_id":{encoded_id},"method":"POST",'
+            f'"url":"{_BATCH_ENDPOINT}","body":{body}}}'
+        )
 
     async def _run_quick_suggest_request(
         self, file_ids: Sequence[str], output_language: str
@@ -329,18 +537,23 @@ class LLMMenuService:
             model=settings.quick_suggestion_model,  # fast, low-latency model for side-call
             instructions=instructions,
             input=[{"role": "user", "content": content}],
-            text={"verbosity": "low"},
-            reasoning={"effort": "minimal"},
+            text=_QUICK_SUGGEST_TEXT_CONFIG,
+            reasoning=_QUICK_SUGGEST_REASONING_CONFIG,
         )
 
         return _extract_output_text(response)
 
 
-def _extract_json_payload(response: object) -> dict:
-    """Traverse the responses API payload to pull JSON content."""
+def _parse_menu_payload(response: object) -> _MenuPayload:
+    """Parse and validate the structured output text in a single pass."""
 
     output_text = _extract_output_text(response)
-    return json.loads(output_text)
+    try:
+        return _MENU_PAYLOAD_ADAPTER.validate_json(output_text)
+    except ValidationError as exc:
+        raise RuntimeError(
+            f"OpenAI response did not match the menu items schema: {output_text}"
+        ) from exc
 
 
 def _extract_output_text(response: object) -> str:
@@ -356,15 +569,22 @@ def _extract_output_text(response: object) -> str:
     return str(output_text).strip()
 
 
-def _build_menu_template(payload: dict) -> MenuTemplate:
-    """Convert the raw payload into the MenuTemplate structure."""
+def _build_menu_template(payload: _MenuPayload) -> MenuTemplate:
+    """Convert the validated payload into the MenuTemplate structure."""
 
-    if not isinstance(payload, dict) or "items" not in payload:
-        raise RuntimeError(f"OpenAI response missing 'items' payload: {payload}")
+    section_titles: List[str] = []
+    raw_dishes: List[dict[str, str | None]] = []
+    for item in payload["items"]:
+        original_raw = item.get("original_name")
+        translated_raw = item.get("translated_name")
+        description_raw = item.get("description")
+        if not original_raw or not translated_raw or not description_raw:
+            continue
 
-    sections: defaultdict[str, List[MenuDish]] = defaultdict(list)
-    for item in payload.get("items", []):
-        if not isinstance(item, dict):
+        original_name = str(original_raw).strip()
+        translated_name = str(translated_raw).strip()
+        description = str(description_raw).strip()
+        if not original_name or not translated_name or not description:
             continue
 
         section_raw = (
@@ -373,30 +593,29 @@ def _build_menu_template(payload: dict) -> MenuTemplate:
             or "Menu"
         )
         section = str(section_raw).strip() or "Menu"
-        original_name = str(item.get("original_name") or "").strip()
-        translated_name = str(item.get("translated_name") or "").strip()
-        description = str(item.get("description") or "").strip()
-        price = _format_price(item.get("price"))
         keywords_value = item.get("keywords")
         keywords = None
-        if keywords_value not in (None, ""):
-            keywords_text = str(keywords_value).strip()
-            if keywords_text:
-                keywords = keywords_text
+        if keywords_value:
+            keywords = str(keywords_value).strip() or None
 
-        if not original_name or not translated_name or not description:
-            continue
-
-        sections[section].append(
-            MenuDish(
-                original_name=original_name,
-                translated_name=translated_name,
-                description=description,
-                price=price,
-                keywords=keywords,
-            )
+        section_titles.append(section)
+        raw_dishes.append(
+            {
+                "original_name": original_name,
+                "translated_name": translated_name,
+                "description": description,
+                "price": _format_price(item.get("price")),
+                "keywords": keywords,
+            }
         )
 
+    # Validate every dish in a single pydantic-core call rather than one
+    # model construction per item, then group while preserving menu order.
+    validated_dishes = _DISHES_ADAPTER.validate_python(raw_dishes)
+    sections: dict[str, List[MenuDish]] = {}
+    for title, dish in zip(section_titles, validated_dishes):
+        sections.setdefault(title, []).append(dish)
+
     section_models = [
         MenuSection(translated_section_name=title, dishes=dishes)
         for title, dishes in sections.items()
@@ -405,15 +624,32 @@ def _build_menu_template(payload: dict) -> MenuTemplate:
     return MenuTemplate(sections=section_models)
 
 
+def _format_int_price(value: int) -> str:
+    return f"{int(value)}"
+
+
+def _format_float_price(value: float) -> str:
+    return f"{int(value)}" if value.is_integer() else f"{value:.2f}"
+
+
+# bool is an int subclass and, like other subclasses, formats as its int value.
+_PRICE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    int: _format_int_price,
+    bool: _format_int_price,
+    float: _format_float_price,
+}
+
+
 def _format_price(value: object) -> str | None:
     """Format numeric prices into display-friendly strings."""
 
-    if value in (None, ""):
+    if value is None or value == "":
         return None
-    if isinstance(value, (int, float)):
-        if isinstance(value, int) or (
-            hasattr(value, "is_integer") and value.is_integer()
-        ):
-            return f"{int(value)}"
-        return f"{value:.2f}"
+    formatter = _PRICE_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, int):
+        return _format_int_price(value)
+    if isinstance(value, float):
+        return _format_float_price(value)
     return str(value)
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import json
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Sequence
 
 __all__ = [
     "JSON_SCHEMA_NAME",
     "LANGUAGE_MARKER",
+    "PromptInput",
     "PromptRequest",
     "RESPONSE_JSON_SCHEMA",
     "build_reasoning_config",
     "build_response_object_schema",
     "build_prompt",
+    "build_prompts_batch",
     "build_text_config",
+    "build_text_config_json",
     "build_text_format_config",
 ]
 
@@ -29,15 +33,13 @@ class PromptRequest:
     content: List[dict[str, str]]
 
 
-# SYSTEM_INSTRUCTIONS = (
-#     "You are a meticulous transcription assistant for restaurant menus. "
-#     "You can recognize the menu language, remember dish names exactly as written, and "
-#     "preserve the original ordering even if the photos are low quality. "
-#     "You can understand regional dishes, can translate them into the requested language, "
-#     "and can summarise flavour, ingredients, and preparation details in a single approachable sentence. "
-#     "Your final goal is to sutrcture the required menu information into desired json format. "
-#     "Some dishes can be on the side of the menu, do not miss any sections and dishes."
-# )
+@dataclass(frozen=True)
+class PromptInput:
+    """Arguments for one prompt built through ``build_prompts_batch``."""
+
+    file_ids: Sequence[str]
+    output_language: str
+
 
 SYSTEM_INSTRUCTIONS = (
     "You are a meticulous transcription assistant for restaurant menus. Given photos of a menu, your responsibilities are: "
@@ -99,6 +101,71 @@ RESPONSE_JSON_SCHEMA: dict[str, object] = {
 }
 
 
+_LANGUAGE_HINT = (
+    "First, detect the primary language used throughout the menu. "
+    "If there's english information, use it as the primary language. "
+    "Remember the menu is written in this language. "
+    "This language is an important information to further processing the menu. "
+)
+
+_STRUCTURE_RULE_TMPL = (
+    "Based on the items in the photos, build a structured menu. "
+    "Keep the original dish name as written on the menu in the original_name field in the JSON. "
+    "Translate dish titles into {lang} and keep it in the translated_name field in the JSON. "
+    "If there's any description, translate it into the {lang}. "
+    "But if there's no description on the menu, write a natural one-sentence description in the "
+    "{lang} describing key ingredients, preparation details, and flavour. "
+    "Do not overdescribe the dishes, do not add quality, quantity, or price details that are not present on the menu. "
+    "If price is listed as 'N/A', keep it as 'N/A'. "
+    "Translate section names into {lang} and store it in the translated_section_name field in the JSON. "
+    "Do not treat a section as a dish. "
+    "Generate keywords to use if I need to search for more information/pictures in google about this dish and store it in the keywords field in the JSON. "
+)
+
+_JSON_RULE = (
+    "Last step, respond strictly with JSON that matches the provided schema. "
+    "Do not include any explanatory text before or after the JSON."
+)
+
+_DOUBLE_CHECK_TMPL = (
+    "Double check the language used in the output json. "
+    "Don't forget to translate section name, translated name and description into {lang}. "
+    "DO NOT treat a section as a dish and put section name in the dish related field"
+)
+
+# A single text part carries all instructions; every extra content item
+# adds framing tokens and payload size without helping the model. Only the
+# output language varies, so the segments are joined once into a template.
+_PREAMBLE_TMPL = "\n\n".join(
+    segment.strip()
+    for segment in (
+        _LANGUAGE_HINT,
+        _STRUCTURE_RULE_TMPL,
+        _JSON_RULE,
+        _DOUBLE_CHECK_TMPL,
+    )
+)
+
+
+_TYPE_TEXT = "input_text"
+_TYPE_IMAGE = "input_image"
+
+
+def _text_entry(text: str) -> dict[str, str]:
+    return {"type": _TYPE_TEXT, "text": text}
+
+
+def _image_entry(file_id: str) -> dict[str, str]:
+    return {"type": _TYPE_IMAGE, "file_id": file_id}
+
+
+@lru_cache(maxsize=32)
+def _static_content(output_language: str) -> tuple[dict[str, str], ...]:
+    """Return the shared, read-only text entries for ``output_language``."""
+
+    return (_text_entry(_PREAMBLE_TMPL.format(lang=output_language)),)
+
+
 def build_prompt(
     file_ids: Sequence[str],
     *,
@@ -109,93 +176,74 @@ def build_prompt(
     if not file_ids:
         raise ValueError("Stage one prompt requires at least one uploaded file id.")
 
-    language_hint = (
-        "First, detect the primary language used throughout the menu. "
-        "If there's english information, use it as the primary language. "
-        "Remember the menu is written in this language. "
-        "This language is an important information to further processing the menu. "
-    )
-
-    transcription_rule = (
-        "Then extract dishes information from ALL the pages. "
-        "Keep the section, dish name and price of each items. "
-        "If a section title is missing, use the 'Menu' as the section. "
-        "Keep dish names in the original language without translation ."
-        "When prices are missing, uses 'N/A'. "
-        "Sometimes the dish name can come with some description, keep it as it is."
-        " Do not prepend bullets or numbering and do not translate anything in this stage."
-        "Don't miss any drinks, sides, sauces, desserts, etc. They can be on the side of the menu. "
-    )
-
-    structure_rule = (
-        "Based on the items in the photos, build a structured menu. "
-        "Keep the original dish name as written on the menu in the original_name field in the JSON. "
-        f"Translate dish titles into {output_language} and keep it in the translated_name field in the JSON. "
-        f"If there's any description, translate it into the {output_language}. "
-        "But if there's no description on the menu, write a natural one-sentence description in the "
-        f"{output_language} describing key ingredients, preparation details, and flavour. "
-        "Do not overdescribe the dishes, do not add quality, quantity, or price details that are not present on the menu. "
-        "If price is listed as 'N/A', keep it as 'N/A'. "
-        f"Translate section names into {output_language} and store it in the translated_section_name field in the JSON. "
-        "Do not treat a section as a dish. "
-        "Generate keywords to use if I need to search for more information/pictures in google about this dish and store it in the keywords field in the JSON. "
-    )
-    json_rule = (
-        "Last step, respond strictly with JSON that matches the provided schema. "
-        "Do not include any explanatory text before or after the JSON."
-    )
-    double_check = (
-        "Double check the language used in the output json. "
-        f"Don't forget to translate section name, translated name and description into {output_language}. "
-        "DO NOT treat a section as a dish and put section name in the dish related field"
-    )
-
     content: List[dict[str, str]] = [
-        {"type": "input_text", "text": language_hint},
-        # {"type": "input_text", "text": transcription_rule},
-        {"type": "input_text", "text": structure_rule},
-        {"type": "input_text", "text": json_rule},
-        {"type": "input_text", "text": double_check},
+        *_static_content(output_language),
+        *[_image_entry(file_id) for file_id in file_ids],
     ]
-    for file_id in file_ids:
-        content.append({"type": "input_image", "file_id": file_id})
 
     return PromptRequest(
         instructions=SYSTEM_INSTRUCTIONS,
         content=content,
     )
 
+
+def build_prompts_batch(inputs: Sequence[PromptInput]) -> List[PromptRequest]:
+    """Return prompts for many menus, sharing the cached per-language text."""
+
+    return [
+        build_prompt(item.file_ids, output_language=item.output_language)
+        for item in inputs
+    ]
+
+
+# The schema and text configs never change at runtime, so they are built once
+# and shared. Callers must treat the returned dicts as read-only.
+_RESPONSE_OBJECT_SCHEMA: dict[str, object] = {
+    "type": "object",
+    "properties": {
+        "items": RESPONSE_JSON_SCHEMA,
+    },
+    "required": ["items"],
+    "additionalProperties": False,
+}
+
+_TEXT_FORMAT_CONFIG: dict[str, object] = {
+    "type": "json_schema",
+    "name": JSON_SCHEMA_NAME,
+    "schema": _RESPONSE_OBJECT_SCHEMA,
+    "strict": True,
+}
+
+_TEXT_CONFIG: dict[str, object] = {
+    "format": _TEXT_FORMAT_CONFIG,
+    "verbosity": "low",
+}
+
+_TEXT_CONFIG_JSON = json.dumps(_TEXT_CONFIG, ensure_ascii=False, separators=(",", ":"))
+
+
 def build_response_object_schema() -> dict[str, object]:
     """Return top-level object schema required by OpenAI Responses."""
 
-    return {
-        "type": "object",
-        "properties": {
-            "items": deepcopy(RESPONSE_JSON_SCHEMA),
-        },
-        "required": ["items"],
-        "additionalProperties": False,
-    }
+    return _RESPONSE_OBJECT_SCHEMA
 
 
 def build_text_format_config() -> dict[str, object]:
     """Return JSON schema formatting config for the OpenAI Responses API."""
 
-    return {
-        "type": "json_schema",
-        "name": JSON_SCHEMA_NAME,
-        "schema": build_response_object_schema(),
-        "strict": True,
-    }
+    return _TEXT_FORMAT_CONFIG
 
 
 def build_text_config() -> dict[str, object]:
     """Return text configuration for the OpenAI Responses API."""
 
-    return {
-        "format": build_text_format_config(),
-        "verbosity": "low",
-    }
+    return _TEXT_CONFIG
+
+
+def build_text_config_json() -> str:
+    """Return the text configuration pre-serialised as compact JSON."""
+
+    return _TEXT_CONFIG_JSON
 
 
 def build_reasoning_config() -> dict[str, object]:
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import logging
+import time
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Tuple, Any, Optional
+from secrets import token_urlsafe
+from typing import Dict, List, Tuple, Any
 
-from sqlalchemy import DateTime, String, delete, select
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.exc import IntegrityError
+import segno
+from sqlalchemy import DateTime, String, cast, delete, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config import settings
 from app.db import Base, get_session_factory
-from app.schemas import MenuTemplate
+from app.schemas import MenuDish, MenuSection, MenuTemplate
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ShareRecord:
     """Metadata about a stored share token."""
 
@@ -24,12 +32,16 @@ class ShareRecord:
     template: MenuTemplate
     created_at: datetime
     expires_at: datetime
+    expires_monotonic: float | None = None
 
     @property
     def ttl_seconds(self) -> int:
         """Return remaining lifetime in whole seconds."""
 
-        remaining = (self.expires_at - datetime.now(tz=timezone.utc)).total_seconds()
+        if self.expires_monotonic is not None:
+            remaining = self.expires_monotonic - time.monotonic()
+        else:
+            remaining = (self.expires_at - datetime.now(tz=timezone.utc)).total_seconds()
         return int(remaining) if remaining > 0 else 0
 
 
@@ -44,11 +56,18 @@ class ShareToken(Base):
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
+_PURGE_BATCH_SIZE = 1000
+_PURGE_BATCH_PAUSE_SECONDS = 0.01
+
+
 class InMemoryShareRepository:
     """Ephemeral repository used when no database is available."""
 
     def __init__(self) -> None:
-        self._store: Dict[str, Tuple[MenuTemplate, datetime, datetime]] = {}
+        # Each entry keeps a monotonic deadline for TTL checks; the wall-clock
+        # timestamps are only used to build ShareRecord metadata.
+        self._store: Dict[str, Tuple[MenuTemplate, datetime, datetime, float]] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     async def store(
         self,
@@ -57,26 +76,40 @@ class InMemoryShareRepository:
         created_at: datetime,
         expires_at: datetime,
     ) -> None:
-        self._store[token] = (template, created_at, expires_at)
+        deadline = time.monotonic() + (expires_at - created_at).total_seconds()
+        self._store[token] = (template, created_at, expires_at, deadline)
+        heapq.heappush(self._expiry_heap, (deadline, token))
 
     async def fetch(self, token: str) -> ShareRecord | None:
+        # Reclaim anything already due; with the heap this only touches
+        # expired entries, so lookups keep memory bounded between explicit
+        # purges without ever walking the whole store.
+        now = time.monotonic()
+        self._purge(now)
         record = self._store.get(token)
-        if not record:
+        if record is None:
             return None
-        template, created_at, expires_at = record
-        if datetime.now(tz=timezone.utc) > expires_at:
-            self._store.pop(token, None)
+        template, created_at, expires_at, deadline = record
+        if now > deadline:
+            del self._store[token]
             return None
-        return ShareRecord(token, template, created_at, expires_at)
+        return ShareRecord(token, template, created_at, expires_at, deadline)
 
     async def purge(self) -> None:
-        now = datetime.now(tz=timezone.utc)
-        expired = [key for key, (_, _, expires_at) in self._store.items() if expires_at <= now]
-        for key in expired:
-            self._store.pop(key, None)
+        self._purge(time.monotonic())
 
     def reset(self) -> None:
         self._store.clear()
+        self._expiry_heap.clear()
+
+    def _purge(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            deadline, token = heapq.heappop(heap)
+            record = self._store.get(token)
+            # Skip stale heap entries for tokens already removed or re-stored.
+            if record is not None and record[3] == deadline:
+                del self._store[token]
 
 
 class DatabaseShareRepository:
@@ -92,42 +125,70 @@ class DatabaseShareRepository:
         created_at: datetime,
         expires_at: datetime,
     ) -> None:
-        async with self._session_factory() as session:
-            record = ShareToken(
+        # Serialise with pydantic's JSON encoder and let Postgres parse it,
+        # rather than building a dict for SQLAlchemy to encode again.
+        payload = template.model_dump_json()
+        statement = (
+            pg_insert(ShareToken)
+            .values(
                 token=token,
-                template_json=template.model_dump(),
+                template_json=cast(literal(payload, String), JSONB),
                 created_at=created_at,
                 expires_at=expires_at,
             )
-            session.add(record)
-            try:
-                await session.commit()
-            except IntegrityError:
-                await session.rollback()
-                raise
+            .on_conflict_do_nothing(index_elements=[ShareToken.token])
+            .returning(ShareToken.token)
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(statement)
+            inserted = result.scalar_one_or_none()
+            await session.commit()
+        if inserted is None:
+            raise RuntimeError("Share token collision; template was not stored")
 
     async def fetch(self, token: str) -> ShareRecord | None:
+        # Select plain columns so no mapped instance or identity-map entry is
+        # created for a read-only lookup.
         async with self._session_factory() as session:
             result = await session.execute(
-                select(ShareToken).where(ShareToken.token == token)
+                select(
+                    ShareToken.template_json,
+                    ShareToken.created_at,
+                    ShareToken.expires_at,
+                ).where(ShareToken.token == token)
             )
-            row: Optional[ShareToken] = result.scalar_one_or_none()
-            if row is None:
-                return None
-            now = datetime.now(tz=timezone.utc)
-            if row.expires_at <= now:
-                await session.delete(row)
-                await session.commit()
-                return None
-            template = MenuTemplate.model_validate(row.template_json)
-            return ShareRecord(row.token, template, row.created_at, row.expires_at)
+            row = result.first()
+        if row is None:
+            return None
+        template_json, created_at, expires_at = row
+        # Expired rows stay invisible to callers until purge reclaims them;
+        # deleting here would turn every stale lookup into a write.
+        if expires_at <= datetime.now(tz=timezone.utc):
+            return None
+        return ShareRecord(token, _load_template(template_json), created_at, expires_at)
 
     async def purge(self) -> None:
+        # Delete in small batches so each transaction holds few row locks and
+        # concurrent inserts are never stalled behind one large DELETE.
+        now = datetime.now(tz=timezone.utc)
         async with self._session_factory() as session:
-            await session.execute(
-                delete(ShareToken).where(ShareToken.expires_at <= datetime.now(tz=timezone.utc))
-            )
-            await session.commit()
+            while True:
+                result = await session.execute(
+                    select(ShareToken.token)
+                    .where(ShareToken.expires_at <= now)
+                    .order_by(ShareToken.expires_at)
+                    .limit(_PURGE_BATCH_SIZE)
+                )
+                tokens = result.scalars().all()
+                if not tokens:
+                    break
+                await session.execute(
+                    delete(ShareToken).where(ShareToken.token.in_(tokens))
+                )
+                await session.commit()
+                if len(tokens) < _PURGE_BATCH_SIZE:
+                    break
+                await asyncio.sleep(_PURGE_BATCH_PAUSE_SECONDS)
 
     def reset(self) -> None:  # pragma: no cover - used only in tests
         """Database-backed stores do not support sync resets."""
@@ -146,6 +207,23 @@ class ShareService:
             self._repository = DatabaseShareRepository(session_factory)
         else:
             self._repository = InMemoryShareRepository()
+        self._purge_task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Begin sweeping expired tokens in the background."""
+
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self._purge_loop())
+
+    async def stop(self) -> None:
+        """Cancel the background sweep started by ``start``."""
+
+        task, self._purge_task = self._purge_task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
     async def create_template(self, template: MenuTemplate) -> str:
         """Generate a token and persist the template."""
@@ -172,6 +250,16 @@ class ShareService:
 
         await self._repository.purge()
 
+    async def _purge_loop(self) -> None:
+        # Sweep a few times per TTL so expired rows never pile up for long.
+        interval = max(1.0, self._ttl.total_seconds() / 4)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.purge_expired()
+            except Exception:  # pragma: no cover - keep sweeping on DB hiccups
+                logger.exception("Failed to purge expired share tokens")
+
     def reset(self) -> None:
         """Utility for tests to clear stored templates."""
 
@@ -180,7 +268,28 @@ class ShareService:
             reset_fn()
 
 
-def _generate_token() -> str:
-    from secrets import token_urlsafe
+def share_qr_data_uri(url: str) -> str:
+    """Return the branded QR code PNG for ``url`` as a data URI."""
+
+    return segno.make_qr(url).png_data_uri(scale=4, dark="#1d5bdb", light="#f8fafc")
+
+
+def _load_template(data: dict[str, Any]) -> MenuTemplate:
+    """Rehydrate a template persisted by ``DatabaseShareRepository.store``."""
 
+    if not settings.trust_persisted_templates:
+        return MenuTemplate.model_validate(data)
+    # Rows are written from validated models, so rebuild them without
+    # re-running field validation.
+    sections = [
+        MenuSection.model_construct(
+            translated_section_name=section["translated_section_name"],
+            dishes=[MenuDish.model_construct(**dish) for dish in section["dishes"]],
+        )
+        for section in data.get("sections", ())
+    ]
+    return MenuTemplate.model_construct(**{**data, "sections": sections})
+
+
+def _generate_token() -> str:
     return token_urlsafe(12)
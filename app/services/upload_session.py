@@ -2,19 +2,89 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import heapq
+import json
+import logging
+import os
+import time
+from base64 import urlsafe_b64encode
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import partial
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Sequence, Tuple
-
-from sqlalchemy import DateTime, Integer, String, delete, select, update
-from sqlalchemy.dialects.postgresql import JSONB
+from secrets import token_bytes
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    bindparam,
+    delete,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config import settings
-from app.db import Base, get_session_factory
-
-
-@dataclass(frozen=True)
+from app.db import Base, get_engine, get_read_session_factory, get_session_factory
+
+logger = logging.getLogger(__name__)
+
+# Above this many rows a bulk store switches from INSERT to COPY.
+_COPY_THRESHOLD = 500
+_COPY_COLUMNS = (
+    "token",
+    "file_ids",
+    "filenames",
+    "content_types",
+    "retry_count",
+    "created_at",
+    "expires_at",
+)
+_dump_json = partial(json.dumps, separators=(",", ":"))
+
+# Colliding tokens are skipped by the primary key; the returned tokens tell
+# the caller which sessions were stored.
+_SKIP_TAKEN_TOKENS = " ON CONFLICT (token) DO NOTHING RETURNING token"
+# Bulk writes bind the whole batch as one JSON parameter so every batch size
+# shares a single prepared statement.
+_INSERT_FROM_JSON = text(
+    "INSERT INTO upload_sessions"
+    " (token, file_ids, filenames, content_types, retry_count, created_at, expires_at)"
+    " SELECT token, file_ids, filenames, content_types, retry_count, created_at,"
+    " expires_at FROM json_to_recordset(CAST(:rows AS json)) AS x("
+    "token text, file_ids text[], filenames text[], content_types text[],"
+    " retry_count int, created_at timestamptz, expires_at timestamptz)"
+    + _SKIP_TAKEN_TOKENS
+)
+# COPY cannot skip rows, so large batches are staged in a temporary table.
+_COPY_STAGING_TABLE = "upload_sessions_staging"
+_CREATE_COPY_STAGING = text(
+    f"CREATE TEMPORARY TABLE {_COPY_STAGING_TABLE}"
+    " (LIKE upload_sessions INCLUDING DEFAULTS) ON COMMIT DROP"
+)
+_INSERT_FROM_STAGING = text(
+    "INSERT INTO upload_sessions"
+    " (token, file_ids, filenames, content_types, retry_count, created_at, expires_at)"
+    " SELECT token, file_ids, filenames, content_types, retry_count, created_at,"
+    f" expires_at FROM {_COPY_STAGING_TABLE}" + _SKIP_TAKEN_TOKENS
+)
+_TOKEN_COLLISION = "Upload session token collision; session was not stored"
+# Expired rows are purged in bounded batches, each in its own transaction, so
+# a large backlog never holds one long DELETE.
+_PURGE_BATCH_SIZE = 500
+# With UPLOAD_SESSION_PROCESS_CACHE, recently fetched sessions are served from
+# process memory for a short while.
+_FETCH_CACHE_SIZE = 4096
+_FETCH_CACHE_TTL_SECONDS = 60
+
+
+@dataclass(frozen=True, slots=True)
 class UploadSessionRecord:
     """Persisted metadata required to reuse uploaded files."""
 
@@ -25,12 +95,16 @@ class UploadSessionRecord:
     created_at: datetime
     expires_at: datetime
     retry_count: int = 0
+    expires_at_epoch: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "expires_at_epoch", self.expires_at.timestamp())
 
     @property
     def ttl_seconds(self) -> int:
         """Return remaining lifetime in seconds."""
 
-        remaining = (self.expires_at - datetime.now(tz=timezone.utc)).total_seconds()
+        remaining = self.expires_at_epoch - time.time()
         return int(remaining) if remaining > 0 else 0
 
 
@@ -40,9 +114,9 @@ class UploadSession(Base):
     __tablename__ = "upload_sessions"
 
     token: Mapped[str] = mapped_column(String(96), primary_key=True)
-    file_ids: Mapped[List[str]] = mapped_column(JSONB, nullable=False)
-    filenames: Mapped[List[str]] = mapped_column(JSONB, nullable=False)
-    content_types: Mapped[List[str]] = mapped_column(JSONB, nullable=False)
+    file_ids: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False)
+    filenames: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False)
+    content_types: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False)
     retry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -52,17 +126,28 @@ class InMemoryUploadRepository:
     """Ephemeral backing store used for local development and tests."""
 
     def __init__(self) -> None:
-        self._store: Dict[str, Tuple[UploadSessionRecord, datetime]] = {}
+        # Expiry is kept as an epoch float so hot paths compare against
+        # time.time() instead of building aware datetimes.
+        self._store: Dict[str, Tuple[UploadSessionRecord, float]] = {}
+        # Min-heap of (expires_at, token); entries for deleted or replaced
+        # tokens go stale and are skipped when popped.
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     async def store(self, record: UploadSessionRecord) -> None:
-        self._store[record.token] = (record, record.expires_at)
+        expires_at = record.expires_at_epoch
+        self._store[record.token] = (record, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, record.token))
+
+    async def store_many(self, records: Sequence[UploadSessionRecord]) -> None:
+        for record in records:
+            await self.store(record)
 
     async def fetch(self, token: str) -> UploadSessionRecord | None:
         entry = self._store.get(token)
         if not entry:
             return None
         record, expires_at = entry
-        if expires_at <= datetime.now(tz=timezone.utc):
+        if expires_at <= time.time():
             self._store.pop(token, None)
             return None
         return record
@@ -71,15 +156,15 @@ class InMemoryUploadRepository:
         self._store.pop(token, None)
 
     async def purge(self) -> List[UploadSessionRecord]:
-        now = datetime.now(tz=timezone.utc)
+        now = time.time()
         expired_records: List[UploadSessionRecord] = []
-        expired_tokens = [
-            token for token, (_, expires_at) in self._store.items() if expires_at <= now
-        ]
-        for token in expired_tokens:
-            record_tuple = self._store.pop(token, None)
-            if record_tuple:
-                expired_records.append(record_tuple[0])
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, token = heapq.heappop(heap)
+            entry = self._store.get(token)
+            if entry is not None and entry[1] == expires_at:
+                del self._store[token]
+                expired_records.append(entry[0])
         return expired_records
 
     async def increment_retry(self, token: str) -> int:
@@ -101,100 +186,348 @@ class InMemoryUploadRepository:
 
     def reset(self) -> None:  # pragma: no cover - test helper
         self._store.clear()
+        self._expiry_heap.clear()
+
+
+class _RecordCache:
+    """Bounded LRU of fetched records, each valid for a short, capped TTL."""
+
+    def __init__(self, maxsize: int, ttl_seconds: int) -> None:
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[UploadSessionRecord, float]] = (
+            OrderedDict()
+        )
+
+    def get(self, token: str) -> UploadSessionRecord | None:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        record, valid_until = entry
+        if valid_until <= time.monotonic():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return record
+
+    def put(self, record: UploadSessionRecord) -> None:
+        ttl = min(record.ttl_seconds, self._ttl_seconds)
+        if ttl <= 0:
+            return
+        self._entries[record.token] = (record, time.monotonic() + ttl)
+        self._entries.move_to_end(record.token)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 class DatabaseUploadRepository:
     """Persist upload sessions in Postgres."""
 
-    def __init__(self, session_factory) -> None:
+    def __init__(
+        self,
+        session_factory,
+        engine: AsyncEngine,
+        read_session_factory=None,
+        *,
+        cache_records: bool = False,
+    ) -> None:
         self._session_factory = session_factory
+        # Lookups may go to a read replica; writes always use the primary.
+        self._read_session_factory = read_session_factory
+        # Single-statement writes run in autocommit, skipping BEGIN/COMMIT.
+        self._autocommit_engine = engine.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        # Only invalidated by this process, so it is safe with a single worker
+        # only; see Settings.upload_session_process_cache.
+        self._record_cache: _RecordCache | None = (
+            _RecordCache(_FETCH_CACHE_SIZE, _FETCH_CACHE_TTL_SECONDS)
+            if cache_records
+            else None
+        )
 
     async def store(self, record: UploadSessionRecord) -> None:
+        if record.token not in await self.store_many((record,)):
+            raise RuntimeError(_TOKEN_COLLISION)
+
+    async def store_many(self, records: Sequence[UploadSessionRecord]) -> set[str]:
+        """Write many sessions in one round trip, using COPY for large batches.
+
+        Returns the tokens actually inserted; records whose token is already
+        taken are skipped.
+        """
+
+        if not records:
+            return set()
         async with self._session_factory() as session:
-            row = UploadSession(
-                token=record.token,
-                file_ids=record.file_ids,
-                filenames=record.filenames,
-                content_types=record.content_types,
-                retry_count=record.retry_count,
-                created_at=record.created_at,
-                expires_at=record.expires_at,
-            )
-            session.add(row)
+            if len(records) > _COPY_THRESHOLD:
+                await session.execute(_CREATE_COPY_STAGING)
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    _COPY_STAGING_TABLE,
+                    columns=_COPY_COLUMNS,
+                    records=[
+                        (
+                            record.token,
+                            record.file_ids,
+                            record.filenames,
+                            record.content_types,
+                            record.retry_count,
+                            record.created_at,
+                            record.expires_at,
+                        )
+                        for record in records
+                    ],
+                )
+                result = await session.execute(_INSERT_FROM_STAGING)
+            else:
+                rows = [
+                    {
+                        "token": record.token,
+                        "file_ids": record.file_ids,
+                        "filenames": record.filenames,
+                        "content_types": record.content_types,
+                        "retry_count": record.retry_count,
+                        "created_at": record.created_at.isoformat(),
+                        "expires_at": record.expires_at.isoformat(),
+                    }
+                    for record in records
+                ]
+                result = await session.execute(
+                    _INSERT_FROM_JSON, {"rows": _dump_json(rows)}
+                )
+            inserted = set(result.scalars())
             await session.commit()
+        return inserted
 
     async def fetch(self, token: str) -> UploadSessionRecord | None:
+        cache = self._record_cache
+        if cache is not None:
+            cached = cache.get(token)
+            if cached is not None:
+                return cached
+        if self._read_session_factory is not None:
+            async with self._read_session_factory() as session:
+                result = await session.execute(
+                    _FETCH_LIVE,
+                    {"token": token, "now": datetime.now(tz=timezone.utc)},
+                )
+                row = result.first()
+            if row is not None:
+                record = _record_from_row(row)
+                if cache is not None:
+                    cache.put(record)
+                return record
+            # Missing on the replica: it may have expired (and needs deleting
+            # on the primary) or not have replicated yet.
         async with self._session_factory() as session:
             result = await session.execute(
-                select(UploadSession).where(UploadSession.token == token)
+                _FETCH_LIVE_OR_DELETE,
+                {"token": token, "now": datetime.now(tz=timezone.utc)},
             )
-            row: Optional[UploadSession] = result.scalar_one_or_none()
+            row = result.first()
             if row is None:
-                return None
-            now = datetime.now(tz=timezone.utc)
-            if row.expires_at <= now:
-                await session.delete(row)
+                # The expired branch may have deleted the row.
                 await session.commit()
                 return None
-            return UploadSessionRecord(
-                token=row.token,
-                file_ids=list(row.file_ids),
-                filenames=list(row.filenames),
-                content_types=list(row.content_types),
-                created_at=row.created_at,
-                expires_at=row.expires_at,
-                retry_count=row.retry_count,
-            )
+            record = _record_from_row(row)
+        if cache is not None:
+            cache.put(record)
+        return record
 
     async def delete(self, token: str) -> None:
-        async with self._session_factory() as session:
-            await session.execute(
-                delete(UploadSession).where(UploadSession.token == token)
-            )
-            await session.commit()
+        try:
+            async with self._autocommit_engine.connect() as connection:
+                await connection.execute(_DELETE_BY_TOKEN, {"token": token})
+        finally:
+            # Invalidate after the write so a concurrent fetch cannot re-cache
+            # the old row.
+            self._invalidate_cached(token)
 
     async def purge(self) -> List[UploadSessionRecord]:
-        async with self._session_factory() as session:
-            now = datetime.now(tz=timezone.utc)
-            result = await session.execute(
-                select(UploadSession).where(UploadSession.expires_at <= now)
-            )
-            rows = result.scalars().all()
-            if not rows:
-                return []
-            await session.execute(
-                delete(UploadSession).where(UploadSession.expires_at <= now)
-            )
-            await session.commit()
-            return [
-                UploadSessionRecord(
-                    token=row.token,
-                    file_ids=list(row.file_ids),
-                    filenames=list(row.filenames),
-                    content_types=list(row.content_types),
-                    created_at=row.created_at,
-                    expires_at=row.expires_at,
-                    retry_count=row.retry_count,
-                )
-                for row in rows
-            ]
+        return await self._delete_expired_rows(datetime.now(tz=timezone.utc))
+
+    async def _delete_expired_rows(self, now: datetime) -> List[UploadSessionRecord]:
+        expired: List[UploadSessionRecord] = []
+        while True:
+            async with self._session_factory() as session:
+                result = await session.execute(_PURGE_EXPIRED, {"now": now})
+                rows = result.all()
+                if not rows:
+                    return expired
+                await session.commit()
+            expired.extend(_record_from_row(row) for row in rows)
+            if len(rows) < _PURGE_BATCH_SIZE:
+                return expired
 
     async def increment_retry(self, token: str) -> int:
-        async with self._session_factory() as session:
-            result = await session.execute(
-                update(UploadSession)
-                .where(UploadSession.token == token)
-                .values(retry_count=UploadSession.retry_count + 1)
-                .returning(UploadSession.retry_count)
-            )
-            row = result.first()
-            if row is None:
-                raise KeyError(token)
-            await session.commit()
-            return int(row[0])
+        try:
+            async with self._autocommit_engine.connect() as connection:
+                result = await connection.execute(_INCREMENT_RETRY, {"token": token})
+                row = result.first()
+        finally:
+            self._invalidate_cached(token)
+        if row is None:
+            raise KeyError(token)
+        return int(row[0])
 
     def reset(self) -> None:  # pragma: no cover - tests rely on memory store
-        pass
+        if self._record_cache is not None:
+            self._record_cache.clear()
+
+    def _invalidate_cached(self, token: str) -> None:
+        if self._record_cache is not None:
+            self._record_cache.invalidate(token)
+
+
+class _StoreBatcher:
+    """Coalesce stores that arrive while an earlier write is still in flight.
+
+    A store with nothing in flight is written straight away; stores queued
+    behind it share the next ``store_many`` round trip. Only callers whose
+    token was not inserted see a collision error.
+    """
+
+    def __init__(self, repository: DatabaseUploadRepository) -> None:
+        self._repository = repository
+        self._pending: List[Tuple[UploadSessionRecord, asyncio.Future[None]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def store(self, record: UploadSessionRecord) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((record, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    inserted = await self._repository.store_many(
+                        [record for record, _ in batch]
+                    )
+                except Exception as exc:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                for record, future in batch:
+                    if future.done():
+                        continue
+                    if record.token in inserted:
+                        # Only the first of two identical tokens was stored.
+                        inserted.discard(record.token)
+                        future.set_result(None)
+                    else:
+                        future.set_exception(RuntimeError(_TOKEN_COLLISION))
+        finally:
+            self._flush_task = None
+
+
+class RedisUploadCache:
+    """Redis copy of live upload sessions that expires alongside each record.
+
+    Redis failures are logged and treated as cache misses so Postgres (or the
+    in-memory store) remains the source of truth. Each entry carries the
+    token's version stamp as read before the repository lookup that produced
+    it; ``delete`` bumps the stamp, so a refill racing with a write is ignored.
+    """
+
+    _KEY_PREFIX = "upload_session:"
+    _VERSION_PREFIX = "upload_session_version:"
+
+    def __init__(self, url: str) -> None:
+        from redis.asyncio import Redis
+        from redis.exceptions import RedisError
+
+        self._redis = Redis.from_url(url)
+        self._errors: Tuple[type[BaseException], ...] = (RedisError, OSError)
+        # A stamp only has to outlive the sessions it guards.
+        self._version_ttl = 60 * max(1, settings.upload_session_ttl_minutes)
+
+    async def get(self, token: str) -> UploadSessionRecord | None:
+        try:
+            payload, version = await self._redis.mget(
+                self._KEY_PREFIX + token, self._VERSION_PREFIX + token
+            )
+        except self._errors:
+            logger.warning("Redis lookup failed for upload session", exc_info=True)
+            return None
+        if payload is None:
+            return None
+        try:
+            data = json.loads(payload)
+            if data["version"] != int(version or 0):
+                return None
+            return UploadSessionRecord(
+                token=data["token"],
+                file_ids=data["file_ids"],
+                filenames=data["filenames"],
+                content_types=data["content_types"],
+                created_at=datetime.fromisoformat(data["created_at"]),
+                expires_at=datetime.fromisoformat(data["expires_at"]),
+                retry_count=data["retry_count"],
+            )
+        except (ValueError, TypeError, KeyError):
+            logger.warning("Ignoring malformed cached upload session", exc_info=True)
+            return None
+
+    async def version(self, token: str) -> int | None:
+        """Return the token's version stamp, or ``None`` if it is unavailable."""
+
+        try:
+            value = await self._redis.get(self._VERSION_PREFIX + token)
+        except self._errors:
+            logger.warning("Redis lookup failed for upload session", exc_info=True)
+            return None
+        try:
+            return int(value or 0)
+        except ValueError:
+            return None
+
+    async def set(self, record: UploadSessionRecord, version: int = 0) -> None:
+        ttl = record.ttl_seconds
+        if ttl <= 0:
+            return
+        payload = _dump_json(
+            {
+                "token": record.token,
+                "file_ids": record.file_ids,
+                "filenames": record.filenames,
+                "content_types": record.content_types,
+                "created_at": record.created_at.isoformat(),
+                "expires_at": record.expires_at.isoformat(),
+                "retry_count": record.retry_count,
+                "version": version,
+            }
+        )
+        try:
+            await self._redis.set(self._KEY_PREFIX + record.token, payload, ex=ttl)
+        except self._errors:
+            logger.warning("Redis write failed for upload session", exc_info=True)
+
+    async def delete(self, token: str) -> None:
+        version_key = self._VERSION_PREFIX + token
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.incr(version_key)
+                pipe.expire(version_key, self._version_ttl)
+                pipe.delete(self._KEY_PREFIX + token)
+                await pipe.execute()
+        except self._errors:
+            logger.warning("Redis delete failed for upload session", exc_info=True)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
 
 
 class UploadSessionService:
@@ -203,12 +536,28 @@ class UploadSessionService:
     def __init__(self) -> None:
         self._ttl = timedelta(minutes=max(1, settings.upload_session_ttl_minutes))
         session_factory = get_session_factory()
-        if session_factory is not None:
+        engine = get_engine()
+        if session_factory is not None and engine is not None:
+            repository = DatabaseUploadRepository(
+                session_factory,
+                engine,
+                get_read_session_factory(),
+                # Redis is shared by every worker; a per-process layer on top
+                # would only add staleness.
+                cache_records=(
+                    settings.upload_session_process_cache and not settings.redis_url
+                ),
+            )
             self._repository: InMemoryUploadRepository | DatabaseUploadRepository = (
-                DatabaseUploadRepository(session_factory)
+                repository
             )
+            self._batcher: _StoreBatcher | None = _StoreBatcher(repository)
         else:
             self._repository = InMemoryUploadRepository()
+            self._batcher = None
+        self._cache: RedisUploadCache | None = (
+            RedisUploadCache(settings.redis_url) if settings.redis_url else None
+        )
 
     async def create_session(
         self,
@@ -228,28 +577,128 @@ class UploadSessionService:
             expires_at=expires_at,
             retry_count=0,
         )
-        await self._repository.store(record)
+        if self._batcher is not None:
+            await self._batcher.store(record)
+        else:
+            await self._repository.store(record)
+        if self._cache is not None:
+            await self._cache.set(record)
         return token
 
     async def describe(self, token: str) -> UploadSessionRecord | None:
-        return await self._repository.fetch(token)
+        version: int | None = None
+        if self._cache is not None:
+            cached = await self._cache.get(token)
+            if cached is not None:
+                return cached
+            # Read the stamp before the repository so a write landing in
+            # between leaves this refill stale rather than the cache.
+            version = await self._cache.version(token)
+        record = await self._repository.fetch(token)
+        if record is not None and self._cache is not None and version is not None:
+            await self._cache.set(record, version)
+        return record
 
     async def increment_retry(self, token: str) -> int:
-        return await self._repository.increment_retry(token)
+        # Write first, then invalidate: deleting the key before the write lets
+        # a concurrent describe re-cache the old row for the whole TTL.
+        retry_count = await self._repository.increment_retry(token)
+        if self._cache is not None:
+            await self._cache.delete(token)
+        return retry_count
 
     async def delete(self, token: str) -> None:
         await self._repository.delete(token)
+        if self._cache is not None:
+            await self._cache.delete(token)
 
     async def purge_expired(self) -> List[UploadSessionRecord]:
         return await self._repository.purge()
 
+    async def aclose(self) -> None:
+        if self._cache is not None:
+            await self._cache.aclose()
+
     def reset(self) -> None:  # pragma: no cover - tests only
         reset_fn = getattr(self._repository, "reset", None)
         if callable(reset_fn):
             reset_fn()
 
 
-def _generate_token() -> str:
-    from secrets import token_urlsafe
+_SELECT_COLUMNS = ", ".join(column.name for column in UploadSession.__table__.columns)
+
+
+# Hot statements are built once so SQLAlchemy's compiled cache and the asyncpg
+# prepared-statement cache see the same objects on every call.
+_DELETE_BY_TOKEN = delete(UploadSession).where(
+    UploadSession.token == bindparam("token")
+)
+# SKIP LOCKED lets workers purging at the same time take disjoint batches.
+_PURGE_EXPIRED = (
+    delete(UploadSession)
+    .where(
+        UploadSession.token.in_(
+            select(UploadSession.token)
+            .where(UploadSession.expires_at <= bindparam("now"))
+            .order_by(UploadSession.expires_at)
+            .limit(_PURGE_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+    )
+    .returning(*UploadSession.__table__.columns)
+)
+_INCREMENT_RETRY = (
+    update(UploadSession)
+    .where(UploadSession.token == bindparam("token"))
+    .values(retry_count=UploadSession.retry_count + 1)
+    .returning(UploadSession.retry_count)
+)
+_FETCH_LIVE = text(
+    f"SELECT {_SELECT_COLUMNS} FROM upload_sessions"
+    " WHERE token = :token AND expires_at > :now"
+).columns(*UploadSession.__table__.columns)
+# One round trip: return the live row, or delete it if it has expired.
+_FETCH_LIVE_OR_DELETE = text(
+    "WITH expired AS (DELETE FROM upload_sessions"
+    " WHERE token = :token AND expires_at <= :now)"
+    f" SELECT {_SELECT_COLUMNS} FROM upload_sessions"
+    " WHERE token = :token AND expires_at > :now"
+).columns(*UploadSession.__table__.columns)
+
+
+def _record_from_row(row) -> UploadSessionRecord:
+    return UploadSessionRecord(
+        token=row.token,
+        file_ids=list(row.file_ids),
+        filenames=list(row.filenames),
+        content_types=list(row.content_types),
+        created_at=row.created_at,
+        expires_at=row.expires_at,
+        retry_count=row.retry_count,
+    )
+
+
+_TOKEN_BYTES = 16
+_TOKEN_BATCH = 256
+_token_pool: deque[str] = deque()
+_token_pool_pid = os.getpid()
+
 
-    return token_urlsafe(16)
+def _generate_token() -> str:
+    """Return a token_urlsafe(16)-style token from a batch-filled pool."""
+
+    global _token_pool_pid
+    if _token_pool_pid != os.getpid():
+        # Never share pre-generated tokens with a forked worker.
+        _token_pool.clear()
+        _token_pool_pid = os.getpid()
+    if not _token_pool:
+        entropy = token_bytes(_TOKEN_BYTES * _TOKEN_BATCH)
+        _token_pool.extend(
+            urlsafe_b64encode(entropy[start : start + _TOKEN_BYTES])
+            .rstrip(b"=")
+            .decode("ascii")
+            for start in range(0, len(entropy), _TOKEN_BYTES)
+        )
+    return _token_pool.popleft()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Final, List
+from typing import Any, Final, List, Tuple
 
 
 _STATIC_ROOT: Final[Path] = Path(__file__).parent / "static"
@@ -13,12 +13,13 @@ _MATCHED_PHOTO_PATH: Final[Path] = _STATIC_ROOT / "matched_photo.json"
 
 def _load_matched_photo_feed() -> List[dict[str, Any]]:
     try:
-        raw = _MATCHED_PHOTO_PATH.read_text(encoding="utf-8")
+        raw = _MATCHED_PHOTO_PATH.read_bytes()
     except FileNotFoundError:
         return []
     try:
+        # json.loads detects the encoding and decodes the bytes itself.
         data = json.loads(raw)
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return []
     if not isinstance(data, list):
         return []
@@ -29,11 +30,16 @@ def _load_matched_photo_feed() -> List[dict[str, Any]]:
     return valid_items
 
 
-_MATCHED_PHOTO_FEED: Final[List[dict[str, Any]]] = _load_matched_photo_feed()
+_MATCHED_PHOTO_FEED: Final[Tuple[dict[str, Any], ...]] = tuple(
+    _load_matched_photo_feed()
+)
 
 
-def get_matched_photo_feed() -> List[dict[str, Any]]:
-    """Return the cached matched photo feed loaded at startup."""
+def get_matched_photo_feed() -> Tuple[dict[str, Any], ...]:
+    """Return the shared matched photo feed loaded at startup.
 
-    return list(_MATCHED_PHOTO_FEED)
+    The feed is shared across requests; callers must not mutate its items.
+    """
+
+    return _MATCHED_PHOTO_FEED
 
@@ -0,0 +1,17 @@
+-- Store upload session file metadata as native text arrays instead of JSONB.
+BEGIN;
+
+-- ALTER ... USING cannot contain a subquery, so wrap the conversion.
+CREATE FUNCTION pg_temp.jsonb_to_text_array(value JSONB) RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT COALESCE(array_agg(element), '{}')
+    FROM jsonb_array_elements_text(value) AS element
+$$;
+
+ALTER TABLE upload_sessions
+    ALTER COLUMN file_ids TYPE TEXT[] USING pg_temp.jsonb_to_text_array(file_ids),
+    ALTER COLUMN filenames TYPE TEXT[] USING pg_temp.jsonb_to_text_array(filenames),
+    ALTER COLUMN content_types TYPE TEXT[]
+        USING pg_temp.jsonb_to_text_array(content_types);
+
+COMMIT;
@@ -0,0 +1,71 @@
+"""Extract menus in bulk through the OpenAI Batch API.
+
+Meant for offline ingestion and backfills, not the interactive flow: batches
+are billed at a discount but may take up to 24 hours. The manifest is JSONL,
+one menu per line, naming images already uploaded to the Files API::
+
+    {"custom_id": "menu-1", "file_ids": ["file-abc"], "output_language": "English"}
+
+Each extracted template is written to stdout as one JSON line; menus that
+failed individually are reported on stderr::
+
+    uv run python scripts/ingest_menus_batch.py manifest.jsonl > templates.jsonl
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from app.services.llm import LLMMenuService, MenuBatchJob  # noqa: E402
+
+
+def _load_jobs(manifest: Path) -> list[MenuBatchJob]:
+    jobs = []
+    for line in manifest.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        jobs.append(
+            MenuBatchJob(
+                custom_id=entry["custom_id"],
+                file_ids=entry["file_ids"],
+                output_language=entry.get("output_language"),
+            )
+        )
+    return jobs
+
+
+async def _run(jobs: list[MenuBatchJob]) -> int:
+    service = LLMMenuService()
+    try:
+        results = await service.generate_menu_templates_batch(jobs)
+    finally:
+        await service.aclose()
+    for custom_id, result in results.items():
+        record = {"custom_id": custom_id, "template": result.template.model_dump()}
+        print(json.dumps(record, ensure_ascii=False))
+    missing = [job.custom_id for job in jobs if job.custom_id not in results]
+    for custom_id in missing:
+        print(f"{custom_id}: extraction failed", file=sys.stderr)
+    return 1 if missing else 0
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 1:
+        print("usage: ingest_menus_batch.py MANIFEST.jsonl", file=sys.stderr)
+        return 2
+    jobs = _load_jobs(Path(argv[0]))
+    if not jobs:
+        return 0
+    return asyncio.run(_run(jobs))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,30 @@
+"""Shared fixtures for route tests."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Share one app client (and one lifespan) across the route tests."""
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def large_jpeg_bytes() -> bytes:
+    """Encode the oversized menu photo once per test run."""
+
+    img = Image.new("RGB", (1400, 900), color="white")
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=60)
+    return buffer.getvalue()
@@ -1,18 +1,12 @@
 import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-
-client = TestClient(app)
 
 
 @pytest.fixture(autouse=True)
-def clear_cookies():
+def clear_cookies(client):
     client.cookies.clear()
 
 
-def test_home_respects_simplified_chinese_accept_language() -> None:
+def test_home_respects_simplified_chinese_accept_language(client) -> None:
     response = client.get("/", headers={"Accept-Language": "zh-CN,zh;q=0.9"})
     assert response.status_code == 200
     body = response.text
@@ -20,7 +14,7 @@ def test_home_respects_simplified_chinese_accept_language() -> None:
     assert "添加菜单照片" in body
 
 
-def test_home_defaults_to_english_without_header() -> None:
+def test_home_defaults_to_english_without_header(client) -> None:
     response = client.get("/")
     assert response.status_code == 200
     body = response.text
@@ -28,7 +22,7 @@ def test_home_defaults_to_english_without_header() -> None:
     assert "Add menu photos" in body
 
 
-def test_ui_language_override_sets_cookie_and_changes_locale() -> None:
+def test_ui_language_override_sets_cookie_and_changes_locale(client) -> None:
     response = client.get(
         "/ui-language/zh_Hans",
         headers={"referer": "http://testserver/"},
@@ -42,7 +36,7 @@ def test_ui_language_override_sets_cookie_and_changes_locale() -> None:
     assert "轻松点餐" in follow.text
 
 
-def test_ui_language_browser_option_clears_override() -> None:
+def test_ui_language_browser_option_clears_override(client) -> None:
     client.cookies.set("ui_locale", "zh_Hans")
     response = client.get(
         "/ui-language/browser",
@@ -2,133 +2,157 @@ import asyncio
 from io import BytesIO
 
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import Request, UploadFile
 from PIL import Image
+from starlette.datastructures import Headers
 
-from app.main import app
+from app import main as main_module
+from app.config import settings
 from app.routes import menu as menu_routes
 from app.schemas import MenuDish, MenuSection, MenuTemplate
 from app.services.llm import MenuGenerationResult, MenuProcessingArtifacts
 from app.services.tips import Tip
 
 
-client = TestClient(app)
+# Built once; the routes only read the generated template.
+_FIXTURE_TEMPLATE = MenuTemplate(
+    sections=[
+        MenuSection(
+            translated_section_name="Chef's Picks",
+            dishes=[
+                MenuDish(
+                    original_name="Mapo Tofu",
+                    translated_name="Spicy Mapo Tofu",
+                    description="Classic Sichuan tofu",
+                    price="12",
+                )
+            ],
+        )
+    ]
+)
 
 
-def run(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+async def fake_upload_images(
+    images,
+    filenames,
+    content_types=None,
+):
+    menu_routes._last_uploads = list(images)
+    menu_routes._upload_call_count += 1
+    return [f"file-{index}" for index in range(len(images))]
 
 
-@pytest.fixture(autouse=True)
-def reset_services(monkeypatch):
-    menu_routes._share_service.reset()
-    menu_routes._upload_session_service.reset()
-    menu_routes._expected_output_language = "zh-CN"
-    menu_routes._upload_call_count = 0
+async def fake_generate_template_from_file_ids(
+    file_ids,
+    *,
+    output_language=None,
+) -> MenuGenerationResult:
+    assert output_language == menu_routes._expected_output_language
+    return MenuGenerationResult(template=_FIXTURE_TEMPLATE)
 
-    async def fake_upload_images(
-        images,
-        filenames,
-        content_types=None,
-    ):
-        menu_routes._last_uploads = [bytes(blob) for blob in images]
-        menu_routes._upload_call_count += 1
-        return [f"file-{index}" for index in range(len(images))]
 
-    async def fake_generate_template_from_file_ids(
-        file_ids,
-        *,
-        output_language=None,
-    ) -> MenuGenerationResult:
-        assert output_language == menu_routes._expected_output_language
-        template = MenuTemplate(
-            sections=[
-                MenuSection(
-                    translated_section_name="Chef's Picks",
-                    dishes=[
-                        MenuDish(
-                            original_name="Mapo Tofu",
-                            translated_name="Spicy Mapo Tofu",
-                            description="Classic Sichuan tofu",
-                            price="12",
-                        )
-                    ],
-                )
-            ]
-        )
-        return MenuGenerationResult(template=template)
+async def fake_generate_quick_suggestions_from_file_ids(
+    file_ids,
+    *,
+    output_language=None,
+) -> str:
+    assert output_language == menu_routes._expected_output_language
+    return "Try the Mapo Tofu tonight!"
 
-    async def fake_generate_quick_suggestions_from_file_ids(
-        file_ids,
-        *,
-        output_language=None,
-    ) -> str:
-        assert output_language == menu_routes._expected_output_language
-        return "Try the Mapo Tofu tonight!"
-
-    async def fake_generate_quick_suggestions(
-        images,
-        filenames,
-        content_types=None,
-        *,
-        output_language=None,
-    ):
-        menu_routes._last_uploads = [bytes(blob) for blob in images]
-        return "Try the Mapo Tofu tonight!"
 
-    async def fake_delete_files(file_ids):
-        menu_routes._deleted_file_ids = list(file_ids)
+async def fake_generate_quick_suggestions(
+    images,
+    filenames,
+    content_types=None,
+    *,
+    output_language=None,
+):
+    menu_routes._last_uploads = list(images)
+    return "Try the Mapo Tofu tonight!"
 
+
+async def fake_delete_files(file_ids):
+    menu_routes._deleted_file_ids = list(file_ids)
+
+
+def fake_share_qr_data_uri(url):
+    return "data:image/png;base64,"
+
+
+def fake_jpeg_upload():
+    return [("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))]
+
+
+@pytest.fixture(autouse=True)
+def reset_services(request, client, monkeypatch):
+    client.cookies.clear()
+    menu_routes._share_service.reset()
+    menu_routes._upload_session_service.reset()
+    # Test-only module state; monkeypatch removes it again on teardown.
     monkeypatch.setattr(
-        menu_routes._menu_service,
-        "upload_images",
-        fake_upload_images,
-    )
-    monkeypatch.setattr(
-        menu_routes._menu_service,
-        "generate_template_from_file_ids",
-        fake_generate_template_from_file_ids,
-    )
-    monkeypatch.setattr(
-        menu_routes._menu_service,
-        "generate_quick_suggestions_from_file_ids",
-        fake_generate_quick_suggestions_from_file_ids,
-    )
-    monkeypatch.setattr(
-        menu_routes._menu_service,
-        "generate_quick_suggestions",
-        fake_generate_quick_suggestions,
-    )
-    monkeypatch.setattr(
-        menu_routes._menu_service,
-        "delete_files",
-        fake_delete_files,
+        menu_routes,
+        "_expected_output_language",
+        settings.default_output_language,
+        raising=False,
     )
+    monkeypatch.setattr(menu_routes, "_upload_call_count", 0, raising=False)
+    monkeypatch.setattr(menu_routes, "_last_uploads", [], raising=False)
+    monkeypatch.setattr(menu_routes, "_deleted_file_ids", [], raising=False)
+
+    for name, fake in (
+        ("upload_images", fake_upload_images),
+        ("generate_template_from_file_ids", fake_generate_template_from_file_ids),
+        (
+            "generate_quick_suggestions_from_file_ids",
+            fake_generate_quick_suggestions_from_file_ids,
+        ),
+        ("generate_quick_suggestions", fake_generate_quick_suggestions),
+        ("delete_files", fake_delete_files),
+    ):
+        monkeypatch.setattr(menu_routes._menu_service, name, fake)
+    if "real_qr" not in request.keywords:
+        # Only tests marked real_qr pay for QR PNG encoding.
+        monkeypatch.setattr(menu_routes, "share_qr_data_uri", fake_share_qr_data_uri)
+        monkeypatch.setattr(main_module, "share_qr_data_uri", fake_share_qr_data_uri)
 
     yield
 
     menu_routes._share_service.reset()
     menu_routes._upload_session_service.reset()
-    delattr(menu_routes, "_expected_output_language")
-    if hasattr(menu_routes, "_last_uploads"):
-        delattr(menu_routes, "_last_uploads")
-    if hasattr(menu_routes, "_deleted_file_ids"):
-        delattr(menu_routes, "_deleted_file_ids")
-    if hasattr(menu_routes, "_upload_call_count"):
-        delattr(menu_routes, "_upload_call_count")
 
 
-def test_home_page_renders_template():
+@pytest.fixture
+def zh_headers():
+    return {"accept-language": "zh-CN"}
+
+
+@pytest.fixture
+def processed_menu(client):
+    response = client.post(
+        "/menu/process",
+        files=fake_jpeg_upload(),
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def share_token(client, processed_menu):
+    response = client.post(
+        "/menu/share",
+        json={"template": processed_menu["template"]},
+    )
+    assert response.status_code == 200
+    return response.json()["share_token"]
+
+
+def test_home_page_renders_template(client):
     response = client.get("/")
     assert response.status_code == 200
     assert "Make it easy to order" in response.text
 
 
-def test_process_menu_rejects_invalid_type():
+def test_process_menu_rejects_invalid_type(client):
     response = client.post(
         "/menu/process",
         files=[("files", ("menu.txt", BytesIO(b"invalid"), "text/plain"))],
@@ -137,11 +161,10 @@ def test_process_menu_rejects_invalid_type():
     assert response.json()["detail"] == "Unsupported file type"
 
 
-def test_process_menu_returns_template_without_sharing():
+def test_process_menu_returns_template_without_sharing(client):
     response = client.post(
         "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
+        files=fake_jpeg_upload(),
     )
     assert response.status_code == 200
     payload = response.json()
@@ -155,17 +178,11 @@ def test_process_menu_returns_template_without_sharing():
     assert "share_token" not in payload
 
 
-def test_create_share_link_returns_token_and_urls():
-    response = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    assert response.status_code == 200
-
+@pytest.mark.real_qr
+def test_create_share_link_returns_token_and_urls(client, processed_menu):
     share_response = client.post(
         "/menu/share",
-        json={"template": response.json()["template"]},
+        json={"template": processed_menu["template"]},
     )
     assert share_response.status_code == 200
     share_payload = share_response.json()
@@ -177,73 +194,34 @@ def test_create_share_link_returns_token_and_urls():
     assert share_payload["share_expires_at"]
 
 
-def test_get_shared_menu_returns_template():
-    process = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    assert process.status_code == 200
-
-    share_response = client.post(
-        "/menu/share",
-        json={"template": process.json()["template"]},
-    )
-    token = share_response.json()["share_token"]
-
-    shared = client.get(f"/menu/share/{token}")
+def test_get_shared_menu_returns_template(client, share_token):
+    shared = client.get(f"/menu/share/{share_token}")
     assert shared.status_code == 200
     assert shared.json()["sections"][0]["dishes"][0]["original_name"] == "Mapo Tofu"
 
 
-def test_share_view_renders_html():
-    process = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    assert process.status_code == 200
-
-    share_response = client.post(
-        "/menu/share",
-        json={"template": process.json()["template"]},
-    )
-    token = share_response.json()["share_token"]
-
-    viewer = client.get(f"/share/{token}")
+def test_share_view_renders_html(client, share_token):
+    viewer = client.get(f"/share/{share_token}")
     assert viewer.status_code == 200
     assert "Spicy Mapo Tofu" in viewer.text
 
 
-def test_share_view_respects_browser_language():
-    process = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    assert process.status_code == 200
-
-    share_response = client.post(
-        "/menu/share",
-        json={"template": process.json()["template"]},
-    )
-    token = share_response.json()["share_token"]
-
+def test_share_view_respects_browser_language(client, share_token):
     viewer = client.get(
-        f"/share/{token}", headers={"Accept-Language": "zh-CN,zh;q=0.9"}
+        f"/share/{share_token}", headers={"Accept-Language": "zh-CN,zh;q=0.9"}
     )
     assert viewer.status_code == 200
     assert "菜单准备就绪" in viewer.text
     assert "分享此菜单" in viewer.text
 
 
-def test_process_menu_respects_manual_language_selection():
+def test_process_menu_respects_manual_language_selection(client, zh_headers):
     menu_routes._expected_output_language = "Français"
     response = client.post(
         "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
+        files=fake_jpeg_upload(),
         data={"output_language": "fr"},
-        headers={"accept-language": "zh-CN"},
+        headers=zh_headers,
     )
 
     assert response.status_code == 200
@@ -251,17 +229,37 @@ def test_process_menu_respects_manual_language_selection():
     assert payload["detected_language"] is None
 
 
-def test_process_menu_times_out(monkeypatch):
+def test_routes_take_output_language_from_accept_language(client, zh_headers):
+    # The fakes assert every LLM call receives the browser language.
+    menu_routes._expected_output_language = "zh-CN"
+    processed = client.post(
+        "/menu/process", files=fake_jpeg_upload(), headers=zh_headers
+    )
+    assert processed.status_code == 200
+    session_id = processed.json()["upload_session_id"]
+
+    retried = client.post(
+        "/menu/retry", json={"upload_session_id": session_id}, headers=zh_headers
+    )
+    assert retried.status_code == 200
+
+    suggested = client.post(
+        "/menu/suggest", data={"upload_session_id": session_id}, headers=zh_headers
+    )
+    assert suggested.status_code == 200
+
+
+def test_process_menu_times_out(client, monkeypatch):
     async def slow_generate_template_from_file_ids(
         file_ids,
         *,
         output_language=None,
     ):
-        await asyncio.sleep(0.05)
-        return MenuGenerationResult(template=MenuTemplate(sections=[]))
+        # Never completes; the route's timeout cancels it.
+        await asyncio.Event().wait()
 
     monkeypatch.setattr(
-        menu_routes, "_MENU_PROCESSING_TIMEOUT_SECONDS", 0.01, raising=False
+        menu_routes, "_MENU_PROCESSING_TIMEOUT_SECONDS", 0.001, raising=False
     )
     monkeypatch.setattr(
         menu_routes._menu_service,
@@ -271,24 +269,54 @@ def test_process_menu_times_out(monkeypatch):
 
     response = client.post(
         "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
+        files=fake_jpeg_upload(),
     )
 
     assert response.status_code == 504
     assert response.json()["detail"] == "Menu processing took too long. Please try again."
 
 
-def test_process_menu_downscales_large_images():
-    img = Image.new("RGB", (3000, 2000), color="white")
-    original_bytes = BytesIO()
-    img.save(original_bytes, format="JPEG", quality=95)
-    raw = original_bytes.getvalue()
+def test_process_menu_deletes_upload_when_cancelled(client, monkeypatch):
+    purge_started = asyncio.Event()
+
+    async def blocking_purge(menu_service, session_service):
+        purge_started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(menu_routes, "_purge_expired_sessions", blocking_purge)
+
+    async def cancel_during_purge():
+        upload = UploadFile(
+            BytesIO(b"fake-image"),
+            filename="menu.jpg",
+            headers=Headers({"content-type": "image/jpeg"}),
+        )
+        task = asyncio.create_task(
+            menu_routes.process_menu(
+                Request({"type": "http", "headers": []}),
+                [upload],
+                None,
+                menu_routes._menu_service,
+                menu_routes._upload_session_service,
+            )
+        )
+        await purge_started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    client.portal.call(cancel_during_purge)
+
+    assert menu_routes._upload_call_count == 1
+    assert menu_routes._deleted_file_ids == ["file-0"]
+
+
+def test_process_menu_downscales_large_images(client, large_jpeg_bytes):
+    raw = large_jpeg_bytes
 
     response = client.post(
         "/menu/process",
         files=[("files", ("menu.jpg", BytesIO(raw), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
     )
 
     assert response.status_code == 200
@@ -297,24 +325,15 @@ def test_process_menu_downscales_large_images():
     assert len(processed) < len(raw)
 
     with Image.open(BytesIO(processed)) as downsized:
-        downsized.load()
         assert max(downsized.size) <= 1280
 
 
-def test_retry_menu_reuses_existing_session():
-    response = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    assert response.status_code == 200
-    payload = response.json()
-    session_id = payload["upload_session_id"]
+def test_retry_menu_reuses_existing_session(client, processed_menu):
+    session_id = processed_menu["upload_session_id"]
 
     retry_response = client.post(
         "/menu/retry",
         json={"upload_session_id": session_id},
-        headers={"accept-language": "zh-CN"},
     )
     assert retry_response.status_code == 200
     retry_payload = retry_response.json()
@@ -324,76 +343,61 @@ def test_retry_menu_reuses_existing_session():
         == "Spicy Mapo Tofu"
     )
     assert menu_routes._upload_call_count == 1
-    record = run(menu_routes._upload_session_service.describe(session_id))
+    record = client.portal.call(
+        menu_routes._upload_session_service.describe, session_id
+    )
     assert record is not None
     assert record.retry_count == 1
 
 
-def test_delete_upload_session_releases_files():
-    response = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    session_id = response.json()["upload_session_id"]
+def test_delete_upload_session_releases_files(client, processed_menu):
+    session_id = processed_menu["upload_session_id"]
     delete_response = client.delete(f"/menu/session/{session_id}")
     assert delete_response.status_code == 204
     assert menu_routes._deleted_file_ids == ["file-0"]
-    record = run(menu_routes._upload_session_service.describe(session_id))
+    record = client.portal.call(
+        menu_routes._upload_session_service.describe, session_id
+    )
     assert record is None
 
 
-def test_quick_suggest_with_session_reuses_file_ids():
-    response = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    session_id = response.json()["upload_session_id"]
+def test_quick_suggest_with_session_reuses_file_ids(client, processed_menu):
+    session_id = processed_menu["upload_session_id"]
 
     suggest_response = client.post(
         "/menu/suggest",
         data={"upload_session_id": session_id},
-        headers={"accept-language": "zh-CN"},
     )
     assert suggest_response.status_code == 200
     assert suggest_response.json()["text"] == "Try the Mapo Tofu tonight!"
     assert menu_routes._upload_call_count == 1
 
 
-def test_retry_menu_enforces_limit():
-    response = client.post(
-        "/menu/process",
-        files=[("files", ("menu.jpg", BytesIO(b"fake-image"), "image/jpeg"))],
-        headers={"accept-language": "zh-CN"},
-    )
-    session_id = response.json()["upload_session_id"]
+def test_retry_menu_enforces_limit(client, processed_menu):
+    session_id = processed_menu["upload_session_id"]
 
     for _ in range(5):
         retry_response = client.post(
             "/menu/retry",
             json={"upload_session_id": session_id},
-            headers={"accept-language": "zh-CN"},
         )
         assert retry_response.status_code == 200
 
     final_attempt = client.post(
         "/menu/retry",
         json={"upload_session_id": session_id},
-        headers={"accept-language": "zh-CN"},
     )
     assert final_attempt.status_code == 429
     assert menu_routes._upload_call_count == 1
 
 
-def test_stream_menu_tips(monkeypatch):
-    async def fake_get_tips(*args, limit=6, **kwargs):  # noqa: ARG001
+def test_stream_menu_tips(client, monkeypatch):
+    def fake_get_tips(*args, limit=6, **kwargs):  # noqa: ARG001
         return [
             Tip(
                 title="Pad Thai",
                 body="Sweet, tangy rice noodles popular across Bangkok night markets.",
                 image_url="https://example.com/pad-thai.jpg",
-                source_name="Test Source",
                 source_url="https://example.com",
             )
         ]
@@ -406,8 +410,20 @@ def test_stream_menu_tips(monkeypatch):
         headers={"Accept": "text/event-stream"},
     ) as response:
         assert response.status_code == 200
-        body = "".join(chunk for chunk in response.iter_text())
+        body = response.read().decode("utf-8")
 
     assert "event: tip" in body
     assert "Pad Thai" in body
     assert "event: complete" in body
+
+
+def test_menu_tips_returns_json_without_event_stream(client):
+    response = client.get("/menu/tips")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    tips = response.json()
+    assert len(tips) == 6
+    assert len({tip["title"] for tip in tips}) == 6
+    assert all(tip["source_name"] == "Wikivoyage" for tip in tips)
+    assert all(tip["source_url"].startswith("https://") for tip in tips)
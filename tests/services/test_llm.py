@@ -0,0 +1,33 @@
+from enum import IntEnum
+
+import pytest
+
+from app.services.llm import _format_price
+
+
+class Size(IntEnum):
+    LARGE = 12
+
+
+class Money(float):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        (9, "9"),
+        (0, "0"),
+        (9.0, "9"),
+        (9.5, "9.50"),
+        (True, "1"),
+        (False, "0"),
+        ("12 €", "12 €"),
+        (Size.LARGE, "12"),
+        (Money(3.25), "3.25"),
+    ],
+)
+def test_format_price_matches_the_baseline_output(value, expected):
+    assert _format_price(value) == expected
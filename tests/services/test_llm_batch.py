@@ -0,0 +1,228 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from openai.types import Batch
+
+from app.config import settings
+from app.services import llm
+from app.services.llm import LLMMenuService, MenuBatchJob
+from app.services.prompt import build_prompt, build_text_config
+
+
+def _batch(status, output_file_id=None):
+    return Batch.model_validate(
+        {
+            "id": "batch-1",
+            "object": "batch",
+            "endpoint": "/v1/responses",
+            "completion_window": "24h",
+            "created_at": 0,
+            "input_file_id": "file-input",
+            "status": status,
+            "output_file_id": output_file_id,
+        }
+    )
+
+
+def _response_body(output_text):
+    return {
+        "id": "resp-1",
+        "object": "response",
+        "created_at": 0,
+        "model": settings.openai_model,
+        "output": [
+            {
+                "type": "message",
+                "id": "msg-1",
+                "status": "completed",
+                "role": "assistant",
+                "content": [
+                    {"type": "output_text", "text": output_text, "annotations": []}
+                ],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+    }
+
+
+def _output_line(custom_id, *, status_code=200, body=None, error=None):
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {"status_code": status_code, "body": body},
+            "error": error,
+        }
+    )
+
+
+_MENU_OUTPUT = json.dumps(
+    {
+        "items": [
+            {
+                "translated_section_name": "Noodles",
+                "original_name": "Pad Thai",
+                "translated_name": "Stir-fried Rice Noodles",
+                "description": "Sweet and tangy rice noodles.",
+                "price": 9,
+                "keywords": "pad thai",
+            }
+        ]
+    }
+)
+
+
+class FakeFiles:
+    def __init__(self, output_text):
+        self.uploads = []
+        self.deleted = []
+        self._output_text = output_text
+
+    async def create(self, *, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-input")
+
+    async def content(self, file_id):
+        assert file_id == "file-output"
+        return SimpleNamespace(text=self._output_text)
+
+    async def delete(self, file_id):
+        self.deleted.append(file_id)
+
+
+class FakeBatches:
+    def __init__(self, statuses):
+        self._statuses = iter(statuses)
+        self.created = []
+        self.retrieve_calls = 0
+
+    async def create(self, **kwargs):
+        self.created.append(kwargs)
+        return _batch("validating")
+
+    async def retrieve(self, batch_id):
+        self.retrieve_calls += 1
+        status = next(self._statuses)
+        output_file_id = "file-output" if status == "completed" else None
+        return _batch(status, output_file_id)
+
+
+class FakeOpenAI:
+    def __init__(self, statuses, output_text=""):
+        self.files = FakeFiles(output_text)
+        self.batches = FakeBatches(statuses)
+
+
+@pytest.fixture(autouse=True)
+def no_poll_delay(monkeypatch):
+    monkeypatch.setattr(llm, "_BATCH_POLL_INITIAL_SECONDS", 0.0)
+
+
+def test_batch_polls_until_complete_and_skips_failed_lines():
+    output = "\n".join(
+        [
+            _output_line("menu-ok", body=_response_body(_MENU_OUTPUT)),
+            _output_line("menu-error", error={"code": "server_error"}),
+            _output_line("menu-rejected", status_code=400, body={}),
+            "",
+        ]
+    )
+    client = FakeOpenAI(["validating", "in_progress", "completed"], output)
+    service = LLMMenuService(client=client)
+    jobs = [
+        MenuBatchJob("menu-ok", ["file-a", "file-b"], output_language="Français"),
+        MenuBatchJob("menu-error", ["file-c"]),
+        MenuBatchJob("menu-rejected", ["file-d"]),
+    ]
+
+    results = asyncio.run(service.generate_menu_templates_batch(jobs))
+
+    assert list(results) == ["menu-ok"]
+    dish = results["menu-ok"].template.sections[0].dishes[0]
+    assert dish.translated_name == "Stir-fried Rice Noodles"
+    assert dish.price == "9"
+    assert client.batches.retrieve_calls == 3
+    assert client.batches.created == [
+        {
+            "input_file_id": "file-input",
+            "endpoint": "/v1/responses",
+            "completion_window": "24h",
+        }
+    ]
+    assert client.files.deleted == ["file-input", "file-output"]
+
+    (name, payload, content_type), purpose = client.files.uploads[0]
+    assert (name, content_type, purpose) == (
+        "menu-batch.jsonl",
+        "application/jsonl",
+        "batch",
+    )
+    lines = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+    assert [line["custom_id"] for line in lines] == [job.custom_id for job in jobs]
+    first = lines[0]
+    assert (first["method"], first["url"]) == ("POST", "/v1/responses")
+    assert first["body"]["model"] == settings.openai_model
+    assert first["body"]["text"] == build_text_config()
+    content = first["body"]["input"][0]["content"]
+    assert "Français" in content[0]["text"]
+    assert [part["file_id"] for part in content[1:]] == ["file-a", "file-b"]
+
+
+def test_batch_skips_malformed_output_lines():
+    output = "\n".join(
+        [
+            _output_line("menu-first", body=_response_body(_MENU_OUTPUT)),
+            '{"custom_id": "menu-truncated", "response": {"status_',
+            _output_line("menu-bad-body", body={"id": "resp-1"}),
+            json.dumps({"response": {"status_code": 200}}),
+            _output_line("menu-last", body=_response_body(_MENU_OUTPUT)),
+        ]
+    )
+    client = FakeOpenAI(["completed"], output)
+    service = LLMMenuService(client=client)
+    jobs = [
+        MenuBatchJob(custom_id, ["file-a"])
+        for custom_id in ("menu-first", "menu-truncated", "menu-bad-body", "menu-last")
+    ]
+
+    results = asyncio.run(service.generate_menu_templates_batch(jobs))
+
+    assert list(results) == ["menu-first", "menu-last"]
+
+
+def test_batch_raises_when_the_batch_fails():
+    client = FakeOpenAI(["in_progress", "failed"])
+    service = LLMMenuService(client=client)
+
+    with pytest.raises(RuntimeError, match="ended as failed"):
+        asyncio.run(
+            service.generate_menu_templates_batch([MenuBatchJob("menu", ["file-a"])])
+        )
+
+    assert client.batches.retrieve_calls == 2
+    assert client.files.deleted == ["file-input"]
+
+
+def test_batch_without_jobs_skips_the_api():
+    client = FakeOpenAI([])
+    service = LLMMenuService(client=client)
+
+    assert asyncio.run(service.generate_menu_templates_batch([])) == {}
+    assert client.files.uploads == []
+
+
+def test_batch_line_round_trips_to_the_interactive_request():
+    service = LLMMenuService(client=FakeOpenAI([]))
+    prompt = build_prompt(["file-a"], output_language="日本語")
+
+    line = service._build_batch_line('menu-"1"', prompt)
+
+    assert json.loads(line) == {
+        "custom_id": 'menu-"1"',
+        "method": "POST",
+        "url": "/v1/responses",
+        "body": service._extract_params(prompt),
+    }
@@ -0,0 +1,29 @@
+import json
+import random
+
+from app.services.tips import Tip, TipService
+
+_TIPS = tuple(Tip(title=f"Cuisine {index}", body="…") for index in range(5))
+
+
+def test_get_tips_shuffles_the_whole_catalogue():
+    service = TipService(_TIPS)
+    service._rng = random.Random(7)
+
+    tips = service.get_tips(limit=len(_TIPS) + 3)
+
+    assert tips == tuple(random.Random(7).sample(_TIPS, len(_TIPS)))
+    assert tips != _TIPS
+
+
+def test_get_tips_json_matches_get_tips_selection():
+    service = TipService(_TIPS)
+    service._rng = random.Random(11)
+    expected = [tip.title for tip in service.get_tips(limit=len(_TIPS))]
+
+    service._rng = random.Random(11)
+    payload = json.loads(service.get_tips_json(limit=len(_TIPS)))
+
+    assert [tip["title"] for tip in payload] == expected
+    assert payload[0]["source_name"] == "Wikivoyage"
+    assert service.get_tips_json(limit=0) == b"[]"
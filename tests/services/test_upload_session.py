@@ -0,0 +1,362 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.upload_session import (
+    DatabaseUploadRepository,
+    RedisUploadCache,
+    UploadSessionRecord,
+    UploadSessionService,
+    _StoreBatcher,
+)
+
+
+def _record(token):
+    created_at = datetime.now(tz=timezone.utc)
+    return UploadSessionRecord(
+        token=token,
+        file_ids=[f"file-{token}"],
+        filenames=["menu.jpg"],
+        content_types=["image/jpeg"],
+        created_at=created_at,
+        expires_at=created_at + timedelta(hours=1),
+    )
+
+
+class GatedRepository:
+    """Records each store_many batch; the first write waits for ``release``."""
+
+    def __init__(self, error=None, taken=()):
+        self.batches = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self._error = error
+        self._taken = set(taken)
+
+    async def store_many(self, records):
+        tokens = [record.token for record in records]
+        self.batches.append(tokens)
+        if len(self.batches) == 1:
+            self.started.set()
+            await self.release.wait()
+        if self._error is not None:
+            raise self._error
+        return set(tokens) - self._taken
+
+
+def test_store_batcher_coalesces_stores_queued_behind_a_write():
+    async def scenario():
+        repository = GatedRepository()
+        batcher = _StoreBatcher(repository)
+
+        first = asyncio.create_task(batcher.store(_record("a")))
+        # The lone store is written without waiting for company.
+        await asyncio.wait_for(repository.started.wait(), timeout=1)
+        queued = [
+            asyncio.create_task(batcher.store(_record(token))) for token in "bc"
+        ]
+        await asyncio.sleep(0)
+        repository.release.set()
+        await asyncio.gather(first, *queued)
+        return repository.batches
+
+    assert asyncio.run(scenario()) == [["a"], ["b", "c"]]
+
+
+def test_store_batcher_propagates_write_errors_to_every_caller():
+    async def scenario():
+        repository = GatedRepository(error=RuntimeError("database unavailable"))
+        batcher = _StoreBatcher(repository)
+
+        stores = [
+            asyncio.create_task(batcher.store(_record(token))) for token in "ab"
+        ]
+        await repository.started.wait()
+        repository.release.set()
+        return await asyncio.gather(*stores, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 2
+    for result in results:
+        assert isinstance(result, RuntimeError)
+        assert str(result) == "database unavailable"
+
+
+def test_store_batcher_fails_only_the_colliding_callers():
+    async def scenario():
+        repository = GatedRepository(taken={"b"})
+        repository.release.set()
+        batcher = _StoreBatcher(repository)
+
+        stores = [
+            asyncio.create_task(batcher.store(_record(token))) for token in "abcc"
+        ]
+        return await asyncio.gather(*stores, return_exceptions=True)
+
+    first, taken, fresh, duplicate = asyncio.run(scenario())
+
+    assert first is None
+    assert fresh is None
+    for result in (taken, duplicate):
+        assert isinstance(result, RuntimeError)
+        assert "collision" in str(result)
+
+
+def test_store_batcher_recovers_after_a_failed_write():
+    async def scenario():
+        repository = GatedRepository(error=RuntimeError("boom"))
+        repository.release.set()
+        batcher = _StoreBatcher(repository)
+        with pytest.raises(RuntimeError):
+            await batcher.store(_record("a"))
+        repository._error = None
+        await batcher.store(_record("b"))
+        return repository.batches
+
+    assert asyncio.run(scenario()) == [["a"], ["b"]]
+
+
+class FakeRedis:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def mget(self, *keys):
+        return [self.payload, None]
+
+
+_BAD_DATES = {
+    "token": "a",
+    "file_ids": [],
+    "filenames": [],
+    "content_types": [],
+    "created_at": "yesterday",
+    "expires_at": "tomorrow",
+    "retry_count": 0,
+    "version": 0,
+}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"not json", b"\xff", b'{"token": "a"}', json.dumps(_BAD_DATES).encode()],
+)
+def test_redis_cache_treats_malformed_payloads_as_misses(payload):
+    cache = RedisUploadCache("redis://localhost:6379/0")
+    cache._redis = FakeRedis(payload)
+
+    assert asyncio.run(cache.get("a")) is None
+
+
+class RecordingCache:
+    def __init__(self, calls):
+        self._calls = calls
+
+    async def delete(self, token):
+        self._calls.append(("cache.delete", token))
+
+
+class RecordingRepository:
+    def __init__(self, calls):
+        self._calls = calls
+
+    async def increment_retry(self, token):
+        self._calls.append(("repository.increment_retry", token))
+        return 1
+
+    async def delete(self, token):
+        self._calls.append(("repository.delete", token))
+
+
+def test_service_writes_repository_before_invalidating_the_cache():
+    calls = []
+    service = UploadSessionService()
+    service._repository = RecordingRepository(calls)
+    service._cache = RecordingCache(calls)
+
+    assert asyncio.run(service.increment_retry("a")) == 1
+    asyncio.run(service.delete("b"))
+
+    assert calls == [
+        ("repository.increment_retry", "a"),
+        ("cache.delete", "a"),
+        ("repository.delete", "b"),
+        ("cache.delete", "b"),
+    ]
+
+
+class RecordingConnection:
+    def __init__(self, calls, row):
+        self._calls = calls
+        self._row = row
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, parameters):
+        self._calls.append(("execute", parameters["token"]))
+        return SimpleNamespace(first=lambda: self._row)
+
+
+class RecordingEngine:
+    def __init__(self, calls, row=None):
+        self._calls = calls
+        self.row = row
+
+    def execution_options(self, **options):
+        return self
+
+    def connect(self):
+        return RecordingConnection(self._calls, self.row)
+
+
+class RecordingRecordCache:
+    def __init__(self, calls):
+        self._calls = calls
+
+    def invalidate(self, token):
+        self._calls.append(("invalidate", token))
+
+
+def test_repository_writes_before_invalidating_the_record_cache():
+    calls = []
+    engine = RecordingEngine(calls, row=(2,))
+    repository = DatabaseUploadRepository(None, engine, cache_records=True)
+    repository._record_cache = RecordingRecordCache(calls)
+
+    assert asyncio.run(repository.increment_retry("a")) == 2
+    asyncio.run(repository.delete("b"))
+    engine.row = None
+    with pytest.raises(KeyError):
+        asyncio.run(repository.increment_retry("c"))
+
+    assert calls == [
+        ("execute", "a"),
+        ("invalidate", "a"),
+        ("execute", "b"),
+        ("invalidate", "b"),
+        ("execute", "c"),
+        ("invalidate", "c"),
+    ]
+
+
+class DictCache:
+    def __init__(self):
+        self.records = {}
+
+    async def get(self, token):
+        return self.records.get(token)
+
+    async def version(self, token):
+        return 0
+
+    async def set(self, record, version=0):
+        self.records[record.token] = record
+
+    async def delete(self, token):
+        self.records.pop(token, None)
+
+
+def test_retry_right_after_create_finds_the_persisted_session():
+    async def scenario():
+        service = UploadSessionService()
+        service._cache = DictCache()
+        service._batcher = _StoreBatcher(service._repository)
+        token = await service.create_session(["file-a"], ["menu.jpg"], ["image/jpeg"])
+        retry_count = await service.increment_retry(token)
+        return retry_count, await service.describe(token)
+
+    retry_count, record = asyncio.run(scenario())
+
+    assert retry_count == 1
+    assert record.retry_count == 1
+
+
+class DictPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def incr(self, key):
+        self._commands.append(lambda: self._redis.incr(key))
+
+    def expire(self, key, seconds):
+        pass
+
+    def delete(self, key):
+        self._commands.append(lambda: self._redis.values.pop(key, None))
+
+    async def execute(self):
+        for command in self._commands:
+            command()
+
+
+class DictRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key) or 0) + 1
+
+    def pipeline(self, transaction=True):
+        return DictPipeline(self)
+
+
+class SlowFetchRepository:
+    """Delegates to ``inner``; fetch pauses after reading until ``release``."""
+
+    def __init__(self, inner):
+        self._inner = inner
+        self.fetched = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def fetch(self, token):
+        record = await self._inner.fetch(token)
+        self.fetched.set()
+        await self.release.wait()
+        return record
+
+    async def increment_retry(self, token):
+        return await self._inner.increment_retry(token)
+
+
+def test_describe_refill_racing_a_write_does_not_stick():
+    async def scenario():
+        service = UploadSessionService()
+        await service._repository.store(_record("a"))
+        repository = SlowFetchRepository(service._repository)
+        service._repository = repository
+        cache = RedisUploadCache("redis://localhost:6379/0")
+        cache._redis = DictRedis()
+        service._cache = cache
+
+        describe = asyncio.create_task(service.describe("a"))
+        await repository.fetched.wait()
+        await service.increment_retry("a")
+        repository.release.set()
+        # The first describe read the row before the retry was recorded.
+        await describe
+        return await service.describe("a")
+
+    assert asyncio.run(scenario()).retry_count == 1